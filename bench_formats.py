@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# SLU Alumni Project — output format benchmark
+# Builds every table once in memory, then times writing it in each output format
+# and reports the resulting file sizes.
+# Run:
+#   python bench_formats.py [--rows N] [--formats csv parquet ...] [--report FILE.csv|FILE.json]
+
+import argparse
+import os
+import tempfile
+import time
+
+import pandas as pd
+
+from slu_seed import generator as gen
+from slu_seed.formats import FORMATS, write_frame
+
+def build_tables(n):
+    students = gen.make_students(n)
+    employers = gen.make_employers(n)
+    jobs = gen.make_jobs(students, employers, n)
+    events = gen.make_events(n)
+    alumni = gen.make_alumni(students, jobs, n)
+    return {
+        "students_1": students,
+        "employers_1": employers,
+        "jobs_1": jobs,
+        "events_1": events,
+        "alumni_1": alumni,
+        "event_attendance_1": gen.make_event_attendance(events, students, n),
+        "engagements_1": gen.make_engagements(alumni, employers, events, n),
+    }
+
+def bench_formats(tables, formats, out_dir):
+    results = []
+    for fmt in formats:
+        for name, df in tables.items():
+            path = os.path.join(out_dir, f"{name}.{fmt}")
+            t0 = time.perf_counter()
+            write_frame(df, path, fmt)
+            seconds = time.perf_counter() - t0
+            results.append({
+                "format": fmt,
+                "table": name,
+                "rows": len(df),
+                "write_seconds": round(seconds, 4),
+                "rows_per_sec": round(len(df) / seconds) if seconds else None,
+                "bytes": os.path.getsize(path),
+            })
+    return pd.DataFrame(results)
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark write time and file size per output format.")
+    ap.add_argument("--rows", type=int, default=100_000, help="rows per table (default: %(default)s)")
+    ap.add_argument("--formats", nargs="+", choices=FORMATS, default=FORMATS)
+    ap.add_argument("--as-of", default="2025-10-24T00:00:00", help="ISO timestamp used as 'now'")
+    ap.add_argument("--report", help="also save the results as .csv or .json")
+    return ap.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    gen.set_clock(args.as_of)
+    tables = build_tables(args.rows)
+    with tempfile.TemporaryDirectory() as out_dir:
+        results = bench_formats(tables, args.formats, out_dir)
+
+    totals = results.groupby("format", sort=False)[["write_seconds", "bytes"]].sum()
+    totals["mb"] = (totals["bytes"] / 1e6).round(2)
+    with pd.option_context("display.width", 120, "display.max_rows", None):
+        print(results.to_string(index=False))
+        print()
+        print(totals.to_string())
+    if args.report:
+        if args.report.endswith(".json"):
+            results.to_json(args.report, orient="records", indent=2)
+        else:
+            results.to_csv(args.report, index=False)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# SLU Alumni Project — generator benchmark
+# Runs every make_* stage (students ... engagements, data_dictionary) at a grid of
+# row counts and records wall time, rows/sec and peak traced memory per stage, plus
+# the scaling exponent against the previous size (~1 = linear, ~2 = quadratic).
+# Run:
+#   python bench_seed_generator.py [--sizes 1000 10000 ...] [--engine numpy|rows]
+#                                  [--report FILE.csv|FILE.json] [--profile DIR]
+
+import argparse
+import cProfile
+import gc
+import json
+import math
+import os
+import platform
+import pstats
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from slu_seed import generator as gen
+from slu_seed.dictionary import make_data_dictionary
+
+SIZES = [1_000, 10_000, 100_000, 1_000_000]
+
+def stages(n, engine):
+    # (stage, builder) in dependency order; each builder reads the tables built before it
+    return [
+        ("students", lambda t: gen.make_students(n, engine)),
+        ("employers", lambda t: gen.make_employers(n, engine)),
+        ("jobs", lambda t: gen.make_jobs(t["students"], t["employers"], n, engine)),
+        ("events", lambda t: gen.make_events(n, engine)),
+        ("alumni", lambda t: gen.make_alumni(t["students"], t["jobs"], n, engine)),
+        ("event_attendance", lambda t: gen.make_event_attendance(t["events"], t["students"], n, engine)),
+        ("engagements", lambda t: gen.make_engagements(t["alumni"], t["employers"], t["events"], n, engine)),
+        ("data_dictionary", lambda t: make_data_dictionary({f"{k}_1": v for k, v in t.items()})),
+    ]
+
+def git_commit():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                             cwd=os.path.dirname(os.path.abspath(gen.__file__)))
+        return out.stdout.strip() or None
+    except OSError:
+        return None
+
+def bench_size(n, engine, memory=True, profile_dir=None):
+    tables, results = {}, []
+    for stage, build in stages(n, engine):
+        gc.collect()
+        profiler = cProfile.Profile() if profile_dir else None
+        if memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        if profiler:
+            profiler.enable()
+        t0 = time.perf_counter()
+        df = build(tables)
+        seconds = time.perf_counter() - t0
+        if profiler:
+            profiler.disable()
+            dump_profile(profiler, profile_dir, f"{stage}-{n}")
+        peak = tracemalloc.get_traced_memory()[1] - base if memory else None
+        if stage != "data_dictionary":
+            tables[stage] = df
+        results.append({
+            "stage": stage,
+            "rows_requested": n,
+            "rows": len(df),
+            "seconds": round(seconds, 4),
+            "rows_per_sec": round(len(df) / seconds) if seconds else None,
+            "peak_mb": round(peak / 1e6, 2) if memory else None,
+        })
+    return results
+
+def dump_profile(profiler, profile_dir, name):
+    # raw stats for snakeviz/pstats plus a readable top-30 by cumulative time
+    os.makedirs(profile_dir, exist_ok=True)
+    path = os.path.join(profile_dir, f"{name}.prof")
+    profiler.dump_stats(path)
+    with open(os.path.join(profile_dir, f"{name}.txt"), "w") as fh:
+        pstats.Stats(path, stream=fh).sort_stats("cumulative").print_stats(30)
+
+def add_scaling(results):
+    # exponent k in seconds ~ rows_requested**k between consecutive sizes of a stage
+    results["scaling"] = None
+    for stage, group in results.groupby("stage", sort=False):
+        prev = None
+        for idx, row in group.sort_values("rows_requested").iterrows():
+            if prev is not None and prev["seconds"] > 0 and row["seconds"] > 0:
+                results.loc[idx, "scaling"] = round(math.log(row["seconds"] / prev["seconds"])
+                                                    / math.log(row["rows_requested"] / prev["rows_requested"]), 2)
+            prev = row
+    return results
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmark each make_* stage over a grid of row counts.")
+    ap.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="row counts (default: %(default)s)")
+    ap.add_argument("--engine", choices=["numpy", "rows"], default=gen.ENGINE)
+    ap.add_argument("--as-of", default="2025-10-24T00:00:00", help="ISO timestamp used as 'now'")
+    ap.add_argument("--no-memory", action="store_true",
+                    help="skip tracemalloc (peak memory) for cleaner timings")
+    ap.add_argument("--profile", metavar="DIR", help="write a cProfile dump per stage and size to DIR")
+    ap.add_argument("--report", help="also save the results as .csv or .json")
+    return ap.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    gen.set_clock(args.as_of)
+    meta = {
+        "commit": git_commit(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "engine": args.engine,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+    }
+    if not args.no_memory:
+        tracemalloc.start()
+    results = []
+    for n in args.sizes:
+        results += bench_size(n, args.engine, memory=not args.no_memory, profile_dir=args.profile)
+    if not args.no_memory:
+        tracemalloc.stop()
+    results = add_scaling(pd.DataFrame(results))
+    results.insert(0, "commit", meta["commit"])
+
+    with pd.option_context("display.width", 120, "display.max_rows", None):
+        print(results.drop(columns="commit").to_string(index=False))
+    if args.report:
+        if args.report.endswith(".json"):
+            with open(args.report, "w") as fh:
+                json.dump({"meta": meta, "results": results.to_dict(orient="records")}, fh, indent=2)
+        else:
+            results.to_csv(args.report, index=False)
+
+if __name__ == "__main__":
+    main()
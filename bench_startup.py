@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# SLU Alumni Project — startup-time budget
+# Times fresh interpreters doing what CI does many times over: importing the helpers,
+# importing the generator, and a small end-to-end run. Each step is the best of
+# --repeat runs and is checked against its budget (seconds). Importing the helpers
+# (from the package or the slu_seed_generator shim) must not load pandas, numpy or
+# Faker. Exits with status 1 when a budget is exceeded.
+# Run:
+#   python bench_startup.py [--rows N] [--repeat N] [--budget STEP=SECONDS ...]
+#                           [--report FILE.csv|FILE.json]
+
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+HEAVY_MODULES = ["pandas", "numpy", "faker"]
+# generous for a laptop or CI runner; `interpreter` (bare python) is the floor, not budgeted
+BUDGETS = {
+    "interpreter": None,
+    "import_helpers": 0.3,
+    "import_generator": 1.5,
+    "small_run": 3.0,
+}
+
+def steps(rows, out_dir, cache_dir):
+    run = [os.path.join(HERE, "slu_seed_generator.py"), "--rows", str(rows), "--out-dir", out_dir,
+           "--as-of", "2025-10-24T00:00:00", "--name-cache", cache_dir]
+    return {
+        "interpreter": ["-c", "pass"],
+        "import_helpers": ["-c", "import sys, slu_seed; from slu_seed_generator import uid; "
+                                 "print(','.join(m for m in %r if m in sys.modules))" % HEAVY_MODULES],
+        "import_generator": ["-c", "import slu_seed.generator"],
+        "small_run": run,
+    }
+
+def time_step(args, repeat):
+    # -> (best wall seconds, stdout of the last run)
+    best, out = None, ""
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        proc = subprocess.run([sys.executable, *args], cwd=HERE, capture_output=True, text=True)
+        seconds = time.perf_counter() - t0
+        if proc.returncode:
+            raise RuntimeError(f"{' '.join(args)} failed:\n{proc.stderr}")
+        best, out = seconds if best is None else min(best, seconds), proc.stdout
+    return best, out
+
+def budget_arg(text):
+    name, _, seconds = text.partition("=")
+    if name not in BUDGETS or BUDGETS[name] is None:
+        raise argparse.ArgumentTypeError(f"expected STEP=SECONDS with STEP one of "
+                                         f"{', '.join(k for k, v in BUDGETS.items() if v is not None)}")
+    return name, float(seconds)
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Check interpreter + import startup time against a budget.")
+    ap.add_argument("--rows", type=int, default=10, help="rows per table for small_run (default: %(default)s)")
+    ap.add_argument("--repeat", type=int, default=5, help="runs per step, best is kept (default: %(default)s)")
+    ap.add_argument("--budget", type=budget_arg, nargs="+", metavar="STEP=SECONDS",
+                    help="override a budget, e.g. small_run=2.5")
+    ap.add_argument("--report", help="also save the results as .csv or .json")
+    return ap.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    budgets = {**BUDGETS, **dict(args.budget or [])}
+    results, heavy = [], ""
+    with tempfile.TemporaryDirectory() as tmp:
+        cache_dir = os.path.join(tmp, "names")
+        todo = steps(args.rows, os.path.join(tmp, "out"), cache_dir)
+        time_step(todo["small_run"], 1)   # fill the name cache and the bytecode caches first
+        for step, cmd in todo.items():
+            seconds, out = time_step(cmd, args.repeat)
+            if step == "import_helpers":
+                heavy = out.strip()
+            budget = budgets[step]
+            results.append({
+                "step": step,
+                "seconds": round(seconds, 3),
+                "budget": budget,
+                "ok": budget is None or seconds <= budget,
+            })
+    results = pd.DataFrame(results)
+    if heavy:
+        results.loc[results["step"] == "import_helpers", "ok"] = False
+
+    with pd.option_context("display.width", 120):
+        print(results.to_string(index=False))
+    if heavy:
+        print(f"\nimporting the helpers loaded: {heavy}")
+    if args.report:
+        if args.report.endswith(".json"):
+            results.to_json(args.report, orient="records", indent=2)
+        else:
+            results.to_csv(args.report, index=False)
+    if not results["ok"].all():
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+# SLU Alumni Project — synthetic data generator package
+#   slu_seed.helpers     per-row helpers (uid, weighted_choice, rand_phone, clean_email), stdlib only
+#   slu_seed.keys        table names, primary and foreign keys, stdlib only
+#   slu_seed.dictionary  data_dictionary profiler (pandas, numpy)
+#   slu_seed.formats     csv / parquet / feather writers
+#   slu_seed.sinks       sqlite / duckdb sinks
+#   slu_seed.validate    referential integrity checks
+#   slu_seed.generator   tables, the generation pipeline and the CLI
+# Importing the package loads only the helpers; any other name (slu_seed.generate,
+# slu_seed.make_students, ...) imports the generator the first time it is used.
+
+import importlib
+
+from .helpers import SEED, clean_email, make_weighted_choice, rand_phone, uid, weighted_choice
+
+__all__ = ["SEED", "clean_email", "make_weighted_choice", "rand_phone", "uid", "weighted_choice"]
+
+MODULES = ["generator", "dictionary", "formats", "sinks", "validate", "keys", "helpers"]
+
+def owner(name):
+    # the module that holds `name`: the generator, or one of the modules it is built from
+    for module in MODULES:
+        module = importlib.import_module(f"{__name__}.{module}")
+        if hasattr(module, name):
+            return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __getattr__(name):
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name in MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    return getattr(owner(name), name)
@@ -0,0 +1,232 @@
+# SLU Alumni Project — data_dictionary (single table for all)
+
+import io
+import json
+import os
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+DATA_DICTIONARY_COLUMNS = [
+    "table_name","column_name","data_type","is_primary_key","is_foreign_key",
+    "foreign_table","foreign_column","is_nullable","allowed_values","description",
+    "example_value","used_in_dashboard","distinct_count"
+]
+# Columns are profiled chunk by chunk: every column keeps a k-minimum-values sketch
+# (the SKETCH_SIZE smallest 64-bit hashes of its values), which gives its distinct
+# count (exact below SKETCH_SIZE) and, compared across tables, how many of an *_id
+# column's values are among another table's primary keys. *_id columns hash every
+# value; other text columns hash their first PROFILE_FULL_ROWS rows and then one row in
+# PROFILE_STRIDE (by row position, so whole and chunked tables profile alike). Their
+# allowed_values and distinct_count come from that sample: a column whose sampled values
+# are all distinct is counted as unique, otherwise by the sample's distinct values (a
+# lower bound).
+SKETCH_SIZE = 4096
+PROFILE_FULL_ROWS = 100_000
+PROFILE_STRIDE = 64
+ALLOWED_VALUES_MAX = 25      # list allowed_values for columns with at most this many values
+FK_MIN_CONTAINMENT = 0.99    # share of a column's keys that must resolve to call it a foreign key
+UNIQUE_TOLERANCE = 3 / SKETCH_SIZE ** 0.5
+NO_HASH = np.iinfo(np.uint64).max
+
+def make_data_dictionary(tables):
+    return data_dictionary_frame(profile_tables(tables))
+
+def profile_tables(tables):
+    dd = {tname: {} for tname in tables}
+    for tname, df in tables.items():
+        update_data_dictionary(dd[tname], tname, df)
+    return dd
+
+def new_entry(tname, col, data_type, values):
+    # values: set of the column's values while they can still be listed, or None
+    return {
+        "table_name": tname,
+        "column_name": col,
+        "data_type": data_type,
+        "is_primary_key": 0,
+        "is_foreign_key": 0,
+        "foreign_table": "",
+        "foreign_column": "",
+        "is_nullable": 0,
+        "allowed_values": "",
+        "description": "",
+        "example_value": None,
+        "used_in_dashboard": "",
+        "rows": 0,
+        "present": 0,   # values that are not missing
+        "hashed": 0,    # ... and of those, how many went into the sketch
+        "sketch": np.empty(0, dtype=np.uint64),
+        "values": values,
+    }
+
+def update_data_dictionary(entries, tname, df):
+    # fold a whole table, or one chunk of it, into its entries; the first chunk fixes data_type
+    for col, dtype in df.dtypes.items():
+        entry = entries.get(col)
+        if entry is None:
+            entry = entries[col] = new_entry(tname, col, str(dtype),
+                                             set() if dtype.kind not in "fmM" and not col.endswith("_id") else None)
+        values = df[col]
+        # typed columns mark missing values as NaN/NaT; only text columns can still hold ""
+        present = values.notna()
+        text = values.dtype == object or pd.api.types.is_string_dtype(values.dtype)
+        if text:
+            present &= values != ""
+        present = present.to_numpy()
+        start = entry["rows"]
+        entry["rows"] += len(values)
+        if not present.all():
+            entry["is_nullable"] = 1
+        if entry["example_value"] is None and present.any():
+            entry["example_value"] = example_text(values.iloc[int(present.argmax())])
+        entry["present"] += int(present.sum())
+        if text and not col.endswith("_id"):
+            sample = profile_rows(start, len(values))
+            values, present = values.iloc[sample], present[sample]
+        if not present.all():
+            values = values[present]
+        entry["hashed"] += len(values)
+        if entry["values"] is not None:
+            values = pd.Series(values.unique())   # few distinct values: hash each one once
+        entry["sketch"] = update_sketch(entry["sketch"], value_hashes(values))
+        if entry["values"] is not None:
+            # exact while the sketch is: stop once the column has too many values to list
+            if len(entry["sketch"]) > ALLOWED_VALUES_MAX:
+                entry["values"] = None
+            else:
+                entry["values"].update(values)
+
+def profile_rows(start, n):
+    # positions, within a chunk that starts at table row `start`, of the sampled rows
+    full = max(0, min(n, PROFILE_FULL_ROWS - start))
+    first = start + full + -(start + full) % PROFILE_STRIDE
+    return np.r_[np.arange(full), np.arange(first - start, n, PROFILE_STRIDE)]
+
+def distinct_count(entry):
+    found = sketch_distinct(entry["sketch"])
+    if entry["hashed"] < entry["present"] and found >= entry["hashed"] * (1 - UNIQUE_TOLERANCE):
+        return round(found * entry["present"] / entry["hashed"])   # sampled, and unique so far
+    return found
+
+def value_hashes(values):
+    # 64-bit hash per value; equal keys hash equal in every table (int64 or Int64, str or object)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        return pd.util.hash_array(values.cat.categories.to_numpy(dtype=object))[values.cat.codes.to_numpy()]
+    if values.dtype.kind in "iu":
+        return pd.util.hash_array(values.to_numpy(dtype=np.int64))
+    if values.dtype.kind in "fmM":
+        return pd.util.hash_array(values.to_numpy())
+    return pd.util.hash_array(values.to_numpy(dtype=object), categorize=False)
+
+def update_sketch(sketch, hashes):
+    # keep the SKETCH_SIZE smallest distinct hashes (sorted)
+    if len(sketch) >= SKETCH_SIZE:
+        hashes = hashes[hashes < sketch[-1]]
+    if len(hashes) > SKETCH_SIZE:
+        # O(n) cut to the smallest hashes; enough if they hold SKETCH_SIZE distinct ones
+        small = sorted_unique(hashes[hashes <= np.partition(hashes, SKETCH_SIZE)[SKETCH_SIZE]])
+        if len(small) >= SKETCH_SIZE:
+            hashes = small
+    return sorted_unique(np.concatenate([sketch, hashes]))[:SKETCH_SIZE]
+
+def sorted_unique(hashes):
+    # sort + neighbour compare; np.unique is far slower on large uint64 arrays
+    hashes = np.sort(hashes)
+    return hashes[np.r_[True, hashes[1:] != hashes[:-1]]] if len(hashes) else hashes
+
+def sketch_distinct(sketch):
+    if len(sketch) < SKETCH_SIZE:
+        return len(sketch)   # every value is in the sketch
+    return round((SKETCH_SIZE - 1) / (float(sketch[-1]) / 2**64))
+
+def containment(child, parent):
+    # share of the child's values that are also parent values, judged on the hash range
+    # both sketches cover completely
+    limit = min(child[-1] if len(child) >= SKETCH_SIZE else NO_HASH,
+                parent[-1] if len(parent) >= SKETCH_SIZE else NO_HASH)
+    child = child[child <= limit]
+    return float(np.isin(child, parent, assume_unique=True).mean()) if len(child) else 0.0
+
+def infer_keys(dd):
+    # primary key: the first *_id column of a table that is never missing and unique;
+    # foreign key: another *_id column whose values resolve to a primary key of another
+    # table, preferring the table whose key name the column ends with
+    pks = {}
+    for tname, entries in dd.items():
+        for col, e in entries.items():
+            if (col.endswith("_id") and e["rows"] and not e["is_nullable"]
+                    and sketch_distinct(e["sketch"]) >= e["rows"] * (1 - UNIQUE_TOLERANCE)):
+                e["is_primary_key"] = 1
+                pks[tname] = (col, e["sketch"])
+                break
+    for tname, entries in dd.items():
+        for col, e in entries.items():
+            if not col.endswith("_id") or e["is_primary_key"] or not len(e["sketch"]):
+                continue
+            found = [(t, pk) for t, (pk, sketch) in pks.items()
+                     if t != tname and containment(e["sketch"], sketch) >= FK_MIN_CONTAINMENT]
+            named = [(t, pk) for t, pk in found if col.endswith(pk)]
+            found = named or (found if len(found) == 1 else [])
+            if found:
+                e["is_foreign_key"] = 1
+                e["foreign_table"], e["foreign_column"] = found[0]
+
+def allowed_text(values):
+    return " | ".join(example_text(v) for v in sorted_values(values)) if values else ""
+
+def sorted_values(values):
+    try:
+        return sorted(values)
+    except TypeError:   # mixed types (rows engine)
+        return sorted(values, key=str)
+
+def example_text(value):
+    # one value as it appears in the CSV
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat(sep=" ") if value != value.normalize() else value.date().isoformat()
+    return str(value)
+
+def data_dictionary_frame(dd):
+    infer_keys(dd)
+    rows = [dict(e, example_value=e["example_value"] or "", allowed_values=allowed_text(e["values"]),
+                 distinct_count=distinct_count(e))
+            for entries in dd.values() for e in entries.values()]
+    return pd.DataFrame(rows, columns=DATA_DICTIONARY_COLUMNS)
+
+# The profile behind the dictionary (sketches, listed values, row counts) is saved next
+# to it on request (--save-profile), so --append folds in only the rows it adds instead
+# of re-reading every table.
+PROFILE_FILE = "data_dictionary.profile.npz"
+PROFILE_FIELDS = ["data_type", "is_nullable", "example_value", "rows", "present", "hashed"]
+
+def save_profile(dd, path):
+    meta, sketches = {}, {}
+    for tname, entries in dd.items():
+        meta[tname] = {}
+        for col, e in entries.items():
+            values = None if e["values"] is None else [v.item() if isinstance(v, np.generic) else v
+                                                      for v in sorted_values(e["values"])]
+            meta[tname][col] = dict({k: e[k] for k in PROFILE_FIELDS}, values=values)
+            sketches[f"{tname}.{col}"] = e["sketch"]
+    # an .npz like np.savez writes, but with fixed entry dates so the bytes repeat from run to run
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with zipfile.ZipFile(tmp, "w") as zf:
+        for name, arr in {"meta": np.array(json.dumps(meta)), **sketches}.items():
+            buf = io.BytesIO()
+            np.save(buf, arr)
+            zf.writestr(zipfile.ZipInfo(f"{name}.npy", date_time=(1980, 1, 1, 0, 0, 0)), buf.getvalue())
+    os.replace(tmp, path)
+
+def load_profile(path):
+    # -> {table: entries}, ready for update_data_dictionary / data_dictionary_frame
+    dd = {}
+    with np.load(path) as saved:
+        for tname, cols in json.loads(str(saved["meta"])).items():
+            dd[tname] = {}
+            for col, m in cols.items():
+                e = dd[tname][col] = new_entry(tname, col, m["data_type"],
+                                               None if m["values"] is None else set(m["values"]))
+                e.update({k: m[k] for k in PROFILE_FIELDS if k in m}, sketch=saved[f"{tname}.{col}"])
+    return dd
@@ -0,0 +1,120 @@
+# SLU Alumni Project — output formats
+
+import gzip
+import io
+from contextlib import ExitStack
+
+import numpy as np
+import pandas as pd
+
+FORMATS = ["csv", "csv.gz", "csv.zst", "parquet", "feather"]
+# text columns drawn from a small fixed vocabulary; these and all categorical columns
+# are dictionary-encoded in parquet/feather
+DICTIONARY_COLUMNS = {
+    "program_name","college_name","concentration","start_term","grad_term","visa_status","opt_status",
+    "current_location_city","current_location_state","current_location_country",
+    "industry","sub_industry","company_size_band","hq_city","hq_state","hq_country",
+    "slu_partnership_type","slu_partnership_level","slu_partnership_status","primary_contact_title",
+    "job_title","job_family","job_level","job_type","employment_mode","location_city","location_state",
+    "location_country","salary_currency","visa_type","source_channel",
+    "event_type","event_theme","event_description","timezone","delivery_mode","location_venue",
+    "organizer_unit","organizer_contact_email",
+    "current_title","career_stage","skills_primary","skills_secondary","certifications","achievements",
+    "profile_visibility","preferred_contact_method","preferred_time_zone",
+    "registration_status","registration_channel","check_in_method","feedback_comment","no_show_reason",
+    "created_by_user","updated_by_user","updated_at","privacy_level",
+    "engagement_type","engagement_subtype","channel","remarks","status","created_at",
+}
+
+class CsvWriter:
+    # one CSV stream per table, optionally gzip/zstd compressed; the header goes with the
+    # first chunk, so appending chunks gives the same bytes as writing the whole table.
+    # append=True extends an existing file without a header; compressed files get a new
+    # gzip member / zstd frame, which readers decode as one stream.
+    def __init__(self, path, fmt="csv", append=False):
+        self.stack = ExitStack()
+        raw = self.stack.enter_context(open(path, "ab" if append else "wb"))
+        if fmt == "csv.gz":
+            raw = self.stack.enter_context(gzip.GzipFile(filename="", mode="wb", fileobj=raw,
+                                                         compresslevel=6, mtime=0))
+        elif fmt == "csv.zst":
+            try:
+                import zstandard
+            except ImportError as e:
+                raise ImportError("--format csv.zst needs zstandard (pip install zstandard)") from e
+            raw = self.stack.enter_context(zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=False))
+        self.fh = self.stack.enter_context(io.TextIOWrapper(raw, encoding="utf-8", newline=""))
+        self.header = not append
+
+    def write(self, df):
+        df.to_csv(self.fh, header=self.header, index=False)
+        self.header = False
+
+    def close(self):
+        self.stack.close()
+
+class ArrowWriter:
+    # parquet (one row group per chunk) or feather/Arrow IPC (one record batch per chunk).
+    # DICTIONARY_COLUMNS keep one growing dictionary per column, so later chunks only
+    # add dictionary deltas; the other column types are fixed by the first chunk.
+    def __init__(self, path, fmt="parquet"):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(f"--format {fmt} needs pyarrow (pip install pyarrow)") from e
+        self.pa, self.pq = pa, pq
+        self.path, self.fmt = path, fmt
+        self.writer, self.types, self.vocab = None, {}, {}
+
+    def encode(self, col, values):
+        pa = self.pa
+        vocab = self.vocab.setdefault(col, {})
+        codes, uniques = pd.factorize(values)
+        remap = np.array([vocab.setdefault(str(u), len(vocab)) for u in uniques] + [-1], dtype=np.int32)
+        codes = remap[codes]
+        return pa.DictionaryArray.from_arrays(pa.array(codes, mask=codes < 0), pa.array(list(vocab), pa.string()))
+
+    def column(self, col, values):
+        if col in DICTIONARY_COLUMNS or isinstance(values.dtype, pd.CategoricalDtype):
+            return self.encode(col, values)
+        if values.dtype == object:
+            # mixed text/number columns ("" for not applicable) are stored as their CSV text
+            values = values.where(values.isna(), values.astype(str))
+        arr = self.pa.Array.from_pandas(values, type=self.types.get(col))
+        if isinstance(arr, self.pa.ChunkedArray):   # arrow-backed string columns of concatenated chunks
+            arr = arr.combine_chunks()
+        if self.pa.types.is_null(arr.type):
+            arr = arr.cast(self.pa.string())
+        self.types.setdefault(col, arr.type)
+        return arr
+
+    def write(self, df):
+        pa = self.pa
+        batch = pa.RecordBatch.from_arrays([self.column(c, df[c]) for c in df.columns], names=list(df.columns))
+        if self.writer is None:
+            if self.fmt == "parquet":
+                self.writer = self.pq.ParquetWriter(self.path, batch.schema, compression="zstd",
+                                                    use_dictionary=sorted(DICTIONARY_COLUMNS & set(df.columns)))
+            else:
+                options = pa.ipc.IpcWriteOptions(compression="lz4", emit_dictionary_deltas=True)
+                self.writer = pa.ipc.new_file(self.path, batch.schema, options=options)
+        self.writer.write_batch(batch)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+def open_writer(path, fmt="csv", append=False):
+    if not fmt.startswith("csv"):
+        if append:
+            raise ValueError(f"can't append to {fmt} files; use a csv format")
+        return ArrowWriter(path, fmt)
+    return CsvWriter(path, fmt, append)
+
+def write_frame(df, path, fmt="csv"):
+    writer = open_writer(path, fmt)
+    try:
+        writer.write(df)
+    finally:
+        writer.close()
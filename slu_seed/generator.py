@@ -0,0 +1,1921 @@
+# SLU Alumni Project — Synthetic Data Generator
+# Generates 1,000 rows x 20 columns for each table and saves CSVs locally.
+# Requirements: pandas, numpy, faker (+ pyarrow for parquet/feather, zstandard for csv.zst)
+#   pip install pandas numpy faker python-dateutil
+# Run (python -m slu_seed takes the same options):
+#   python slu_seed_generator.py [--rows N] [--chunked] [--workers N] [--format FMT] [--id-mode uuid|int] [--out-dir DIR]
+#                                [--table-rows TABLE=N ...] [--jobs-per-student R] [--config FILE]
+#                                [--sink sqlite:PATH|duckdb:PATH] [--save-profile] [--append TABLE=N ...]
+#
+# Tables are built by a columnar NumPy engine by default (ENGINE = "numpy"); the
+# original per-row loops stay available with engine="rows" / --engine rows.
+# Every table is generated in CHUNK_ROWS-sized chunks, each with its own seeded
+# stream, so --chunked (append each chunk to disk as it is produced, bounded
+# memory) writes exactly the same bytes as building whole tables in memory, and
+# --workers N spreads the chunks over N processes without changing the output.
+#
+# Imports are kept to what a small run needs: Faker is loaded the first time a name
+# table or the rows engine needs it, and pyarrow, zstandard, the database drivers and
+# the process pool only when their option is used. The data dictionary profiler, the
+# output writers, the database sinks and the key checks live in their own modules
+# (dictionary.py, formats.py, sinks.py, validate.py), so validate_keys.py loads only
+# what it uses.
+
+import argparse
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
+from datetime import datetime, timedelta, date
+import random
+import pandas as pd
+import numpy as np
+
+from .dictionary import (PROFILE_FILE, data_dictionary_frame, load_profile, profile_tables, save_profile,
+                         update_data_dictionary)
+from .formats import FORMATS, open_writer
+from .helpers import SEED, clean_email, make_weighted_choice, rand_phone, uid
+from .keys import PRIMARY_KEYS, TABLE_NAMES
+from .sinks import open_sink
+from .validate import check_references, read_keys
+
+ROWS = 1000
+ENGINE = "numpy"   # "numpy" = columnar arrays, "rows" = original per-row loop
+ID_MODE = "uuid"   # "uuid" = seeded uuid4-style text keys, "int" = int64 row-number keys
+CHUNK_ROWS = 100_000
+# clock used by the NumPy engine; pin it with --as-of for reproducible files
+NOW = datetime.utcnow().replace(microsecond=0)
+TODAY = NOW.date()
+np.random.seed(SEED)
+
+# ---------- Helpers ----------
+# uid, make_weighted_choice, rand_phone and clean_email live in helpers.py (no heavy imports)
+FAKER = None
+FAKER_LOCK = threading.Lock()
+
+def faker():
+    # the rows engine's Faker instance, created and seeded on first use
+    global FAKER
+    with FAKER_LOCK:
+        if FAKER is None:
+            from faker import Faker
+            FAKER = Faker()
+            Faker.seed(SEED)
+        return FAKER
+
+def __getattr__(name):
+    # `fake` used to be created at import time; keep it reachable as a module attribute
+    if name == "fake":
+        return faker()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# ---------- Columnar helpers (NumPy engine) ----------
+def set_clock(as_of):
+    global NOW, TODAY
+    NOW = datetime.fromisoformat(as_of).replace(microsecond=0)
+    TODAY = NOW.date()
+
+def set_id_mode(mode):
+    global ID_MODE
+    ID_MODE = mode
+
+def init_worker(as_of, id_mode):
+    # pool initializer: worker processes use the parent's clock and id mode
+    set_clock(as_of)
+    set_id_mode(id_mode)
+
+def make_rng(table, chunk=0, start=0):
+    # one stream per (table, chunk): results don't depend on build order or chunking.
+    # Rows appended after `start` existing rows get streams of their own.
+    return np.random.default_rng([SEED, zlib.crc32(table.encode()), chunk] + ([start] if start else []))
+
+def as_object(values):
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = list(values)
+    return arr
+
+def categorical(values, codes):
+    # values[codes] built straight from the codes; "" / None become missing values
+    value_codes, categories = pd.factorize(as_object([v or None for v in values]))
+    return pd.Categorical.from_codes(value_codes[codes], categories)
+
+def choice_array(rng, values, n):
+    return categorical(values, rng.integers(0, len(values), n))
+
+def pick_rows(rng, rows, n):
+    # random.choice over a list of tuples -> one categorical per tuple position
+    idx = rng.integers(0, len(rows), n)
+    return [categorical(col, idx) for col in zip(*rows)]
+
+def weighted_choice_array(rng, pairs, n):
+    w = np.array([w for _, w in pairs], dtype=float)
+    return categorical([v for v, _ in pairs], rng.choice(len(pairs), size=n, p=w / w.sum()))
+
+def rand_phone_array(rng, n):
+    num = (rng.integers(200, 1000, n) * 10_000_000
+           + rng.integers(200, 1000, n) * 10_000
+           + rng.integers(1000, 10000, n))
+    return "+1" + pd.Series(num).astype(str)
+
+def clean_email_array(s):
+    return s.str.lower().str.replace(" ", "", regex=False)
+
+def row_numbers(n, start=0):
+    i = np.arange(start + 1, start + n + 1)
+    return i, pd.Series(i).astype(str)
+
+def days_ago_array(rng, lo, hi, n):
+    # TODAY - randint(lo, hi) days, as datetime64[D]
+    return np.datetime64(TODAY) - rng.integers(lo, hi + 1, n).astype("timedelta64[D]")
+
+def uniform_array(rng, lo, hi, n):
+    # round(uniform(lo, hi), 2) as float32; written to CSV exactly like the float64 value
+    return np.round(rng.uniform(lo, hi, n), 2).astype(np.float32)
+
+HEX_DIGITS = np.frombuffer(b"0123456789abcdef", dtype=np.uint8)
+
+def uuid_strings(raw):
+    # RFC 4122 version-4 text for each 16-byte block of raw, same as str(uuid.UUID(bytes=..., version=4))
+    b = np.frombuffer(raw, dtype=np.uint8).reshape(-1, 16).copy()
+    b[:, 6] = (b[:, 6] & 0x0F) | 0x40   # version 4
+    b[:, 8] = (b[:, 8] & 0x3F) | 0x80   # RFC 4122 variant
+    digits = np.empty((len(b), 32), dtype=np.uint8)
+    digits[:, 0::2] = HEX_DIGITS[b >> 4]
+    digits[:, 1::2] = HEX_DIGITS[b & 0x0F]
+    text = np.insert(digits, [8, 12, 16, 20], ord("-"), axis=1)
+    return np.ascontiguousarray(text, dtype=np.uint32).view("U36").ravel()
+
+def id_array(rng, n, start=0):
+    # primary keys for rows start..start+n-1: uuid4-style ids drawn from the chunk's
+    # stream, or the 1-based row numbers with ID_MODE = "int". The bytes are drawn
+    # either way, so the other columns don't depend on the id mode.
+    raw = rng.bytes(16 * n)
+    if ID_MODE == "int":
+        return np.arange(start + 1, start + n + 1, dtype=np.int64)
+    return uuid_strings(raw)
+
+def id_series(keys):
+    # compact id keys -> column: uuid bytes decode to text ("" = none), int ids
+    # become nullable Int64 (-1 = none)
+    if keys.dtype.kind == "S":
+        return from_bytes(keys)
+    return pd.Series(pd.arrays.IntegerArray(keys.astype(np.int64), keys < 0))
+
+# ---------- Name pools (NumPy engine) ----------
+# Faker's per-call provider dispatch was the slowest per-row step, so the locale's
+# first/last name tables (values + frequency weights) are read once and whole name
+# columns are drawn from them by index. With --name-cache DIR the tables are kept in
+# an .npz per locale and Faker version, so later runs don't instantiate Faker at all.
+NAME_LOCALE = "en_US"
+NAME_CACHE_DIR = None
+NAME_POOLS = {}
+NAME_POOLS_LOCK = threading.Lock()   # table threads share one build per locale
+
+def name_pools(locale=NAME_LOCALE, cache_dir=None):
+    # {"first_name": values, "first_name_p": weights, "last_name": ..., "last_name_p": ...}
+    cache_dir = NAME_CACHE_DIR if cache_dir is None else cache_dir
+    with NAME_POOLS_LOCK:
+        if (locale, cache_dir) not in NAME_POOLS:
+            NAME_POOLS[locale, cache_dir] = load_name_pools(locale, cache_dir)
+        return NAME_POOLS[locale, cache_dir]
+
+def load_name_pools(locale, cache_dir):
+    path = None
+    if cache_dir:
+        import importlib.metadata
+        path = os.path.join(cache_dir, f"names-{locale}-faker{importlib.metadata.version('faker')}.npz")
+    if path and os.path.exists(path):
+        with np.load(path) as cached:
+            pools = {k: cached[k] for k in cached.files}
+    else:
+        pools = build_name_pools(locale)
+        if path:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as fh:
+                np.savez(fh, **pools)
+            os.replace(tmp, path)
+    return {k: v.astype(object) if v.dtype.kind == "U" else v for k, v in pools.items()}
+
+def build_name_pools(locale=NAME_LOCALE):
+    from faker import Faker
+    person = next(p for p in Faker(locale).get_providers() if hasattr(p, "first_names"))
+    pools = {}
+    for col, table in (("first_name", person.first_names), ("last_name", person.last_names)):
+        # weighted tables are dicts (name -> frequency); plain tuples are uniform
+        weights = np.array(list(table.values()) if isinstance(table, dict) else [1.0] * len(table))
+        pools[col] = np.array(list(table), dtype=str)
+        pools[f"{col}_p"] = weights / weights.sum()
+    return pools
+
+def name_array(rng, pools, col, n):
+    values = pools[col]
+    return pd.Series(values[rng.choice(len(values), size=n, p=pools[f"{col}_p"])], dtype=str)
+
+# ---------- Typed columns ----------
+# Every NumPy-engine table has a schema of compact dtypes: fixed-vocabulary text is
+# categorical, flags and counts are small ints, optional numbers are float32 with NaN
+# and dates are datetime64 with NaT. Missing values replace the old "" sentinels, and
+# to_csv writes every one of these exactly like the strings they replace.
+def category(values):
+    return pd.CategoricalDtype([v for v in dict.fromkeys(values) if v])
+
+def typed(df, schema):
+    # cast the columns that were not generated in their schema dtype already
+    for col, dtype in schema.items():
+        if df[col].dtype == dtype:
+            continue
+        if isinstance(dtype, pd.CategoricalDtype):
+            # "" sentinels are not categories, so they become missing values
+            df[col] = pd.Categorical.from_codes(dtype.categories.get_indexer(df[col]), dtype=dtype)
+        else:
+            df[col] = df[col].astype(dtype)
+    return df
+
+# ---------- Parent keys (compact columns handed to dependent tables) ----------
+def to_bytes(values):
+    values = pd.Series(values)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(object)
+    values = values.fillna("").astype(str)
+    try:
+        return np.array(values.to_numpy(dtype=object), dtype="S")   # ASCII (ids, codes): encoded in C
+    except UnicodeEncodeError:
+        return values.str.encode("utf-8").to_numpy(dtype="S")
+
+def from_bytes(arr):
+    return pd.Series(arr).str.decode("utf-8")
+
+def compact_keys(df, cols):
+    # text -> fixed-width UTF-8 bytes, int ids -> int64, counts/flags -> int32,
+    # *_datetime -> datetime64[s]
+    keys = {}
+    for c in cols:
+        if c.endswith("_datetime"):
+            keys[c] = pd.to_datetime(df[c]).to_numpy().astype("datetime64[s]")
+        elif pd.api.types.is_numeric_dtype(df[c]):
+            keys[c] = df[c].to_numpy(dtype=np.int64 if c.endswith("_id") else np.int32)
+        else:
+            keys[c] = to_bytes(df[c])
+    return keys
+
+def concat_keys(parts):
+    return {c: np.concatenate([p[c] for p in parts]) for c in parts[0]} if parts else {}
+
+def slice_keys(keys, lo, hi):
+    return {c: v[lo:hi] for c, v in keys.items()}
+
+class SharedKeys(dict):
+    # column -> .npy path; pool workers memory-map parent keys instead of receiving copies
+    rows = 0
+
+SHARED_ARRAYS = {}
+
+def share_keys(tmp_dir, name, keys):
+    shared = SharedKeys()
+    for col, arr in keys.items():
+        shared[col] = os.path.join(tmp_dir, f"{name}.{col}.npy")
+        np.save(shared[col], arr)
+    shared.rows = key_rows(keys)
+    return shared
+
+def resolve_keys(keys):
+    # SharedKeys -> memory-mapped arrays; anything else is returned unchanged
+    if not isinstance(keys, SharedKeys):
+        return keys
+    for path in keys.values():
+        if path not in SHARED_ARRAYS:
+            SHARED_ARRAYS[path] = np.load(path, mmap_mode="r")
+    return {c: SHARED_ARRAYS[p] for c, p in keys.items()}
+
+def release_keys(tmp_dir):
+    # forget the memory maps of one run's shared keys before its files are removed
+    for path in [p for p in SHARED_ARRAYS if os.path.dirname(p) == tmp_dir]:
+        del SHARED_ARRAYS[path]
+
+def key_rows(keys):
+    if isinstance(keys, SharedKeys):
+        return keys.rows
+    return len(next(iter(keys.values()))) if keys else 0
+
+def chunk_ranges(n, size=None):
+    # an empty table is one empty chunk, so it still has its columns (and key dtypes)
+    size = size or CHUNK_ROWS
+    for k, lo in enumerate(range(0, max(n, 1), size)):
+        yield k, lo, min(lo + size, n)
+
+def concat_chunks(chunks):
+    chunks = list(chunks)
+    return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
+
+# ---------- Chunk tasks ----------
+# A table is a list of (builder, args) chunk tasks. run_serial executes them in
+# process; run_pool fans them out to worker processes. Either way results come back
+# in task order, and every task carries its own make_rng(table, chunk) stream.
+def run_task(fn, args):
+    return fn(*[resolve_keys(a) for a in args])
+
+def run_serial(tasks):
+    for fn, args in tasks:
+        yield run_task(fn, args)
+
+def run_pool(pool, tasks, window):
+    # keep up to `window` chunks in flight, so finished-but-unwritten chunks stay bounded
+    pending = deque()
+    try:
+        for fn, args in tasks:
+            pending.append(pool.submit(run_task, fn, args))
+            if len(pending) >= window:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for f in pending:
+            f.cancel()
+
+class SerialExecutor:
+    # stands in for the table thread pool when workers=1: runs each call right away
+    def submit(self, fn, *args):
+        f = Future()
+        f.set_result(fn(*args))
+        return f
+
+# ---------- 1) students_1 (20 cols) ----------
+STUDENT_PROGRAMS = [
+    ("MS Information Systems", "School of Science & Engineering", "Data Analytics"),
+    ("MS Computer Science", "School of Science & Engineering", "AI & ML"),
+    ("MS Data Science", "School of Science & Engineering", "Big Data"),
+    ("MS Software Engineering", "School of Science & Engineering", "Cloud Computing"),
+    ("MS Business Analytics", "Chaifetz School of Business", "Predictive Modeling"),
+    ("MBA", "Chaifetz School of Business", "Business Analytics"),
+    ("MS Cybersecurity", "School of Science & Engineering", "Network Security"),
+    ("MS Information Technology", "School of Science & Engineering", "Networking"),
+]
+STUDENT_START_TERMS = ["Fall-2023","Spring-2024","Fall-2024","Spring-2025"]
+STUDENT_GRAD_TERMS  = ["Spring-2025","Fall-2025","Spring-2026","Fall-2026"]
+STUDENT_CITIES = [
+    ("St. Louis","MO","USA"), ("Chicago","IL","USA"), ("Dallas","TX","USA"),
+    ("Austin","TX","USA"), ("Seattle","WA","USA"), ("Boston","MA","USA"),
+    ("New York","NY","USA"), ("Hyderabad",None,"India"), ("Bengaluru",None,"India")
+]
+VISA_WEIGHTS = [("F1", 6), ("H1B",1), ("PR",1), ("Citizen",1), ("Other",1)]
+OPT_WEIGHTS = [("None",1), ("OPT",2), ("STEM OPT",2)]
+pick_visa = make_weighted_choice(VISA_WEIGHTS)   # rows engine draws
+pick_opt = make_weighted_choice(OPT_WEIGHTS)
+# key columns handed to jobs and alumni; generate() leaves out the name columns, and the
+# alumni chunks redraw names from the students' streams (see student_names)
+STUDENT_KEYS = ["student_id", "opt_status"]
+STUDENT_NAME_KEYS = ["slu_email", "first_name", "last_name"]
+STUDENT_SCHEMA = {
+    "program_name": category(p for p, _, _ in STUDENT_PROGRAMS),
+    "college_name": category(c for _, c, _ in STUDENT_PROGRAMS),
+    "concentration": category(c for _, _, c in STUDENT_PROGRAMS),
+    "start_term": category(STUDENT_START_TERMS),
+    "grad_term": category(STUDENT_GRAD_TERMS),
+    "graduation_year": "int16",
+    "visa_status": category(v for v, _ in VISA_WEIGHTS),
+    "opt_status": category(v for v, _ in OPT_WEIGHTS),
+    "current_location_city": category(c for c, _, _ in STUDENT_CITIES),
+    "current_location_state": category(st for _, st, _ in STUDENT_CITIES),
+    "current_location_country": category(k for _, _, k in STUDENT_CITIES),
+}
+
+def make_students(n=ROWS, engine=ENGINE):
+    return make_students_rows(n) if engine == "rows" else concat_chunks(iter_students(n))
+
+def iter_students(n=ROWS, run=run_serial, names=None, start=0):
+    # start: rows already written (append mode); numbering and ids continue from there
+    names = name_pools() if names is None else names
+    return run((make_students_np, (hi - lo, make_rng("students", k, start), start + lo, names))
+               for k, lo, hi in chunk_ranges(n))
+
+def make_students_np(n=ROWS, rng=None, start=0, names=None):
+    rng = make_rng("students") if rng is None else rng
+    names = name_pools() if names is None else names
+    i, num = row_numbers(n, start)
+    first, last = draw_names(rng, names, n)
+
+    prog, college, conc = pick_rows(rng, STUDENT_PROGRAMS, n)
+    visa = weighted_choice_array(rng, VISA_WEIGHTS, n)
+    opt = weighted_choice_array(rng, OPT_WEIGHTS, n)
+    opt[visa != "F1"] = "None"
+    city, state, country = pick_rows(rng, STUDENT_CITIES, n)
+
+    return typed(pd.DataFrame({
+        "student_id": id_array(rng, n, start),
+        "slu_banner_id": ("B" + (100000 + pd.Series(i)).astype(str).str.zfill(7)).str[:8],
+        "first_name": first,
+        "last_name": last,
+        "preferred_name": first.where(i % 4 != 0, None),
+        "slu_email": slu_email_array(first, last, num),
+        "personal_email": clean_email_array((first + "." + last + num + "@example.com").str.lower()),
+        "phone_e164": rand_phone_array(rng, n),
+        "program_name": prog,
+        "college_name": college,
+        "concentration": conc,
+        "start_term": choice_array(rng, STUDENT_START_TERMS, n),
+        "grad_term": choice_array(rng, STUDENT_GRAD_TERMS, n),
+        "graduation_year": (2024 + (i % 3)).astype(np.int16),
+        "visa_status": visa,
+        "opt_status": opt,
+        "current_location_city": city,
+        "current_location_state": state,
+        "current_location_country": country,
+        "linkedin_url": "https://www.linkedin.com/in/slu-student-" + num,
+    }), STUDENT_SCHEMA)
+
+def draw_names(rng, names, n):
+    # the first draws of every students chunk stream
+    return name_array(rng, names, "first_name", n), name_array(rng, names, "last_name", n)
+
+def slu_email_array(first, last, num):
+    return clean_email_array((first.str[0] + last + "." + num + "@slu.edu").str.lower())
+
+def student_names(lo, hi, n_students, names=None):
+    # slu_email / first_name / last_name of students lo..hi of a generated students table
+    # (no append), redrawn from its chunk streams; the last draws of each chunk are not needed
+    names = name_pools() if names is None else names
+    parts = {c: [] for c in STUDENT_NAME_KEYS}
+    for k, c_lo, c_hi in chunk_ranges(n_students):
+        if c_hi <= lo or c_lo >= hi:
+            continue
+        first, last = draw_names(make_rng("students", k), names, c_hi - c_lo)
+        a, b = max(lo, c_lo) - c_lo, min(hi, c_hi) - c_lo
+        first, last = first[a:b].reset_index(drop=True), last[a:b].reset_index(drop=True)
+        for c, v in zip(STUDENT_NAME_KEYS, (slu_email_array(first, last, row_numbers(b - a, c_lo + a)[1]),
+                                            first, last)):
+            parts[c].append(v)
+    return {c: pd.concat(v, ignore_index=True) if v else pd.Series([], dtype=str) for c, v in parts.items()}
+
+def make_students_rows(n=ROWS):
+    rows = []
+    for i in range(1, n+1):
+        first = faker().first_name()
+        last  = faker().last_name()
+        preferred = first if i % 4 != 0 else None
+
+        prog, college, conc = random.choice(STUDENT_PROGRAMS)
+        st = random.choice(STUDENT_START_TERMS)
+        gt = random.choice(STUDENT_GRAD_TERMS)
+        gy = 2024 + (i % 3)
+
+        visa = pick_visa()
+        if visa == "F1":
+            opt = pick_opt()
+        else:
+            opt = "None"
+
+        city, state, country = random.choice(STUDENT_CITIES)
+        slu_email = f"{first[0]}{last}.{i}@slu.edu".lower()
+        personal  = f"{first}.{last}{i}@example.com".lower()
+
+        rows.append({
+            "student_id": uid(),
+            "slu_banner_id": f"B{100000 + i:07d}"[0:8],
+            "first_name": first,
+            "last_name": last,
+            "preferred_name": preferred,
+            "slu_email": clean_email(slu_email),
+            "personal_email": clean_email(personal),
+            "phone_e164": rand_phone(),
+            "program_name": prog,
+            "college_name": college,
+            "concentration": conc,
+            "start_term": st,
+            "grad_term": gt,
+            "graduation_year": gy,
+            "visa_status": visa,
+            "opt_status": opt,
+            "current_location_city": city,
+            "current_location_state": state if state else "",
+            "current_location_country": country,
+            "linkedin_url": f"https://www.linkedin.com/in/slu-student-{i}",
+        })
+    return pd.DataFrame(rows)
+
+# ---------- 2) employers_1 (20 cols) ----------
+EMPLOYER_INDUSTRIES = [
+    ("Technology","Cloud/Software"),
+    ("Consulting","IT Services"),
+    ("Healthcare","Provider"),
+    ("Finance","Banking"),
+    ("Education","University"),
+    ("Manufacturing","Industrial"),
+    ("Retail","E-commerce"),
+    ("Government","Public Sector")
+]
+EMPLOYER_CITIES = [
+    ("St. Louis","MO","USA"), ("Chicago","IL","USA"), ("Dallas","TX","USA"),
+    ("Austin","TX","USA"), ("Seattle","WA","USA"), ("New York","NY","USA"),
+    ("San Jose","CA","USA"), ("Hyderabad",None,"India")
+]
+SIZE_BANDS = ["Small","Medium","Large","Enterprise"]
+PARTNERSHIP_TYPES = ["None","Hiring","Academic","Mentorship","Sponsorship","Donor"]
+PARTNERSHIP_LEVELS = ["Bronze","Silver","Gold"]
+PARTNERSHIP_STATUSES = ["Active","Prospect","Inactive"]
+EMPLOYER_KEYS = ["employer_id", "is_faang_company", "is_non_profit", "hq_city", "hq_state", "hq_country"]
+EMPLOYER_SCHEMA = {
+    "industry": category(ind for ind, _ in EMPLOYER_INDUSTRIES),
+    "sub_industry": category(sub for _, sub in EMPLOYER_INDUSTRIES),
+    "company_size_band": category(SIZE_BANDS),
+    "hq_city": category(c for c, _, _ in EMPLOYER_CITIES),
+    "hq_state": category(st for _, st, _ in EMPLOYER_CITIES),
+    "hq_country": category(k for _, _, k in EMPLOYER_CITIES),
+    "is_faang_company": "int8",
+    "is_non_profit": "int8",
+    "slu_partnership_type": category(PARTNERSHIP_TYPES),
+    "slu_partnership_level": category(PARTNERSHIP_LEVELS),
+    "slu_partnership_status": category(PARTNERSHIP_STATUSES),
+    "slu_partnership_start_date": "datetime64[s]",
+    "primary_contact_title": category(["Recruiter"]),
+}
+
+def make_employers(n=ROWS, engine=ENGINE):
+    return make_employers_rows(n) if engine == "rows" else concat_chunks(iter_employers(n))
+
+def iter_employers(n=ROWS, run=run_serial, names=None, start=0):
+    names = name_pools() if names is None else names
+    return run((make_employers_np, (hi - lo, make_rng("employers", k, start), start + lo, names))
+               for k, lo, hi in chunk_ranges(n))
+
+def make_employers_np(n=ROWS, rng=None, start=0, names=None):
+    rng = make_rng("employers") if rng is None else rng
+    names = name_pools() if names is None else names
+    i, num = row_numbers(n, start)
+    contact = name_array(rng, names, "first_name", n) + " " + name_array(rng, names, "last_name", n)
+    ind, sub = pick_rows(rng, EMPLOYER_INDUSTRIES, n)
+    city, state, country = pick_rows(rng, EMPLOYER_CITIES, n)
+
+    return typed(pd.DataFrame({
+        "employer_id": id_array(rng, n, start),
+        "employer_name": "Employer " + num.str.zfill(4),
+        "industry": ind,
+        "sub_industry": sub,
+        "company_size_band": choice_array(rng, SIZE_BANDS, n),
+        "hq_city": city,
+        "hq_state": state,
+        "hq_country": country,
+        "website_url": "https://www.example" + num + ".com",
+        "linkedin_url": "https://www.linkedin.com/company/example-" + num,
+        "is_faang_company": (i % 200 == 0).astype(np.int8),
+        "is_non_profit": np.isin(i % 10, (3, 7)).astype(np.int8),
+        "slu_partnership_type": choice_array(rng, PARTNERSHIP_TYPES, n),
+        "slu_partnership_level": choice_array(rng, PARTNERSHIP_LEVELS, n),
+        "slu_partnership_status": choice_array(rng, PARTNERSHIP_STATUSES, n),
+        "slu_partnership_start_date": days_ago_array(rng, 30, 900, n),
+        "primary_contact_name": contact,
+        "primary_contact_title": "Recruiter",
+        "primary_contact_email": clean_email_array("contact" + num + "@example.com"),
+        "primary_contact_phone": rand_phone_array(rng, n),
+    }), EMPLOYER_SCHEMA)
+
+def make_employers_rows(n=ROWS):
+    rows = []
+    for i in range(1, n+1):
+        name = f"Employer {i:04d}"
+        ind, sub = random.choice(EMPLOYER_INDUSTRIES)
+        city, state, country = random.choice(EMPLOYER_CITIES)
+        is_faang = 1 if i % 200 == 0 else 0
+        is_np = 1 if i % 10 in (3,7) else 0
+        rows.append({
+            "employer_id": uid(),
+            "employer_name": name,
+            "industry": ind,
+            "sub_industry": sub,
+            "company_size_band": random.choice(SIZE_BANDS),
+            "hq_city": city,
+            "hq_state": state if state else "",
+            "hq_country": country,
+            "website_url": f"https://www.example{i}.com",
+            "linkedin_url": f"https://www.linkedin.com/company/example-{i}",
+            "is_faang_company": is_faang,
+            "is_non_profit": is_np,
+            "slu_partnership_type": random.choice(PARTNERSHIP_TYPES),
+            "slu_partnership_level": random.choice(PARTNERSHIP_LEVELS),
+            "slu_partnership_status": random.choice(PARTNERSHIP_STATUSES),
+            "slu_partnership_start_date": (date.today() - timedelta(days=random.randint(30,900))).isoformat(),
+            "primary_contact_name": faker().name(),
+            "primary_contact_title": "Recruiter",
+            "primary_contact_email": clean_email(f"contact{i}@example.com"),
+            "primary_contact_phone": rand_phone()
+        })
+    return pd.DataFrame(rows)
+
+# ---------- 3) jobs_1 (20 cols) ----------
+JOB_TITLES = ["Software Engineer","Data Analyst","Data Engineer","QA Engineer","Associate Consultant","Business Analyst","Security Analyst"]
+JOB_FAMILIES = ["Engineering","Analytics","Quality","Consulting","Security"]
+JOB_LEVELS = ["Intern","Junior","Mid","Senior"]
+JOB_TYPES = ["Full-time","Contract","Internship"]
+JOB_MODES  = ["On-site","Hybrid","Remote"]
+JOB_CHANNELS = ["Career Fair","Referral","Handshake","LinkedIn","Direct Apply"]
+JOB_SCHEMA = {
+    "job_title": category(JOB_TITLES),
+    "job_family": category(JOB_FAMILIES),
+    "job_level": category(JOB_LEVELS),
+    "job_type": category(JOB_TYPES),
+    "employment_mode": category(JOB_MODES),
+    "location_city": EMPLOYER_SCHEMA["hq_city"],
+    "location_state": EMPLOYER_SCHEMA["hq_state"],
+    "location_country": EMPLOYER_SCHEMA["hq_country"],
+    "offer_date": "datetime64[s]",
+    "offer_accept_date": "datetime64[s]",
+    "start_date": "datetime64[s]",
+    "end_date": "datetime64[s]",
+    "salary_currency": category(["USD"]),
+    "salary_base_annual": "float32",
+    "bonus_target_pct": "float32",
+    "visa_type": category(["OPT", "STEM OPT", "None"]),
+    "source_channel": category(JOB_CHANNELS),
+}
+
+def make_jobs(students_df, employers_df, n=ROWS, engine=ENGINE):
+    if engine == "rows":
+        return make_jobs_rows(students_df, employers_df, n)
+    stu = compact_keys(students_df, STUDENT_KEYS)
+    emp = compact_keys(employers_df, EMPLOYER_KEYS)
+    return concat_chunks(iter_jobs(stu, emp, n))
+
+def iter_jobs(stu, emp, n=ROWS, latest=None, run=run_serial):
+    # `latest` (see new_latest_jobs) is folded chunk by chunk for make_alumni
+    tasks = ((make_jobs_np, (stu, emp, hi - lo, make_rng("jobs", k), lo)) for k, lo, hi in chunk_ranges(n))
+    for df, student_idx in run(tasks):
+        if latest is not None:
+            update_latest_jobs(latest, df, student_idx)
+        yield df
+
+def sample_parents(rng, keys, n, cols):
+    # draw all n foreign keys up front, then gather only the needed columns by index
+    idx = rng.integers(0, len(keys[cols[0]]), n)
+    return idx, {c: keys[c][idx] for c in cols}
+
+def make_jobs_np(stu, emp, n=ROWS, rng=None, start=0):
+    rng = make_rng("jobs") if rng is None else rng
+    student_idx, stu = sample_parents(rng, stu, n, ["student_id", "opt_status"])
+    _, emp = sample_parents(rng, emp, n, ["employer_id", "is_faang_company", "is_non_profit",
+                                          "hq_city", "hq_state", "hq_country"])
+    faang = emp["is_faang_company"] == 1
+    nonp = emp["is_non_profit"] == 1
+    base = np.where(faang, 100000, np.where(nonp, 60000, 80000))
+    spread = np.where(faang, 60000, np.where(nonp, 30000, 40000))
+    salary = (base + rng.integers(0, spread + 1)).astype(np.float32)
+
+    start_date = np.datetime64(TODAY) - rng.integers(0, 361, n).astype("timedelta64[D]")
+    offer = start_date - rng.integers(1, 41, n).astype("timedelta64[D]")
+    accept = offer + rng.integers(0, 8, n).astype("timedelta64[D]")
+    end = start_date + rng.integers(90, 366, n).astype("timedelta64[D]")
+    end[rng.random(n) >= 0.2] = np.datetime64("NaT")
+    opt = from_bytes(stu["opt_status"])
+
+    df = typed(pd.DataFrame({
+        "job_id": id_array(rng, n, start),
+        "student_id": id_series(stu["student_id"]),
+        "employer_id": id_series(emp["employer_id"]),
+        "job_title": choice_array(rng, JOB_TITLES, n),
+        "job_family": choice_array(rng, JOB_FAMILIES, n),
+        "job_level": choice_array(rng, JOB_LEVELS, n),
+        "job_type": choice_array(rng, JOB_TYPES, n),
+        "employment_mode": choice_array(rng, JOB_MODES, n),
+        "location_city": from_bytes(emp["hq_city"]),
+        "location_state": from_bytes(emp["hq_state"]),
+        "location_country": from_bytes(emp["hq_country"]),
+        "offer_date": offer,
+        "offer_accept_date": accept,
+        "start_date": start_date,
+        "end_date": end,
+        "salary_currency": "USD",
+        "salary_base_annual": salary,
+        "bonus_target_pct": np.round(rng.random(n) * 20, 2).astype(np.float32),
+        "visa_type": opt.where(opt.isin(["OPT", "STEM OPT"]), "None"),
+        "source_channel": choice_array(rng, JOB_CHANNELS, n),
+        "created_at": NOW.isoformat(timespec="seconds"),
+    }), JOB_SCHEMA)
+    return df, student_idx
+
+def make_jobs_rows(students_df, employers_df, n=ROWS):
+    rows = []
+    for i in range(1, n+1):
+        stu = students_df.sample(1, random_state=SEED+i).iloc[0]
+        emp = employers_df.sample(1, random_state=SEED*2+i).iloc[0]
+        faang = emp["is_faang_company"] == 1
+        nonp  = emp["is_non_profit"] == 1
+        base = 100000 if faang else 60000 if nonp else 80000
+        salary = base + random.randint(0, 60000 if faang else 30000 if nonp else 40000)
+        start = date.today() - timedelta(days=random.randint(0,360))
+        offer = start - timedelta(days=random.randint(1,40))
+        rows.append({
+            "job_id": uid(),
+            "student_id": stu["student_id"],
+            "employer_id": emp["employer_id"],
+            "job_title": random.choice(JOB_TITLES),
+            "job_family": random.choice(JOB_FAMILIES),
+            "job_level": random.choice(JOB_LEVELS),
+            "job_type": random.choice(JOB_TYPES),
+            "employment_mode": random.choice(JOB_MODES),
+            "location_city": emp["hq_city"],
+            "location_state": emp["hq_state"],
+            "location_country": emp["hq_country"],
+            "offer_date": offer.isoformat(),
+            "offer_accept_date": (offer + timedelta(days=random.randint(0,7))).isoformat(),
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=random.randint(90, 365))).isoformat() if random.random() < 0.2 else "",
+            "salary_currency": "USD",
+            "salary_base_annual": float(salary),
+            "bonus_target_pct": round(random.random()*20, 2),
+            "visa_type": stu["opt_status"] if stu["opt_status"] in ("OPT","STEM OPT") else "None",
+            "source_channel": random.choice(JOB_CHANNELS),
+            "created_at": datetime.utcnow().isoformat(timespec="seconds")
+        })
+    return pd.DataFrame(rows)
+
+# ---------- 4) events_1 (20 cols) ----------
+EVENT_TYPES = ["Career Fair","Webinar","Workshop","Meetup","Guest Lecture"]
+EVENT_THEMES = ["AI & Data Analytics Careers","Cloud & DevOps Pathways","Cybersecurity Trends 2025","Product & Project Management","Consulting Case Prep","Resume & Interview Mastery","Networking Night","Employer Spotlight"]
+EVENT_MODES = ["In-person","Virtual","Hybrid"]
+TIMEZONES = ["America/Chicago","America/New_York","America/Los_Angeles"]
+EVENT_VENUES = [
+    ("Busch Student Center","St. Louis","MO","USA"),
+    ("Chaifetz Arena","St. Louis","MO","USA"),
+    ("Career Services Hall","Chicago","IL","USA"),
+    ("Tech Innovation Lab","Austin","TX","USA"),
+    ("Data Science Hub","Seattle","WA","USA"),
+    ("Alumni Center","Boston","MA","USA"),
+    ("Virtual Stage","Online","","USA"),
+    ("Global Webinar Room","Online","","USA"),
+]
+EVENT_ORGS = [("Career Services","careerservices@slu.edu"),
+              ("Alumni Office","alumni@slu.edu"),
+              ("School of Science & Engineering","sse-events@slu.edu"),
+              ("Chaifetz School of Business","chaifetz-events@slu.edu"),
+              ("Cybersecurity Center","cybercenter@slu.edu"),
+              ("Data Science Institute","dsi@slu.edu")]
+# capacity range (inclusive) per event type, same order as EVENT_TYPES
+EVENT_CAPACITY = [(500,1200), (200,600), (30,150), (50,200), (80,230)]
+
+EVENT_KEYS = ["event_id", "start_datetime", "registrations_count", "attendees_count"]
+EVENT_SCHEMA = {
+    "event_type": category(EVENT_TYPES),
+    "event_theme": category(EVENT_THEMES),
+    "start_datetime": "datetime64[s]",
+    "end_datetime": "datetime64[s]",
+    "timezone": category(TIMEZONES),
+    "delivery_mode": category(EVENT_MODES),
+    "location_venue": category(v for v, _, _, _ in EVENT_VENUES),
+    "location_city": category(c for _, c, _, _ in EVENT_VENUES),
+    "location_state": category(st for _, _, st, _ in EVENT_VENUES),
+    "location_country": category(k for _, _, _, k in EVENT_VENUES),
+    "organizer_unit": category(u for u, _ in EVENT_ORGS),
+    "organizer_contact_email": category(e for _, e in EVENT_ORGS),
+    "capacity": "uint16",
+    "rsvp_required": "int8",
+    "registrations_count": "uint16",
+    "attendees_count": "uint16",
+    "feedback_score_avg": "float32",
+}
+
+def make_events(n=ROWS, engine=ENGINE):
+    return make_events_rows(n) if engine == "rows" else concat_chunks(iter_events(n))
+
+def iter_events(n=ROWS, run=run_serial, start=0):
+    return run((make_events_np, (hi - lo, make_rng("events", k, start), start + lo)) for k, lo, hi in chunk_ranges(n))
+
+def make_events_np(n=ROWS, rng=None, start=0):
+    rng = make_rng("events") if rng is None else rng
+    i, num = row_numbers(n, start)
+    t = i % len(EVENT_TYPES)
+    etype = pd.Series(as_object(EVENT_TYPES)[t], dtype=str)
+    theme = pd.Series(as_object(EVENT_THEMES)[i % len(EVENT_THEMES)], dtype=str)
+
+    base = np.datetime64(TODAY).astype("datetime64[s]")
+    offset = rng.integers(-180, 180, n) * 86400 + np.array([10, 14, 18])[rng.integers(0, 3, n)] * 3600
+    start_dt = base + offset.astype("timedelta64[s]")
+    end_dt = start_dt + (rng.integers(1, 5, n) * 3600).astype("timedelta64[s]")
+    venue, city, st, country = pick_rows(rng, EVENT_VENUES, n)
+    org_unit, org_email = pick_rows(rng, EVENT_ORGS, n)
+
+    lo, hi = (np.array(c) for c in zip(*EVENT_CAPACITY))
+    cap = rng.integers(lo[t], hi[t] + 1)
+    regs = np.minimum(cap, 100 + rng.integers(0, 601, n))
+    atts = np.minimum(regs, 80 + rng.integers(0, 401, n))
+    fb = uniform_array(rng, 3.5, 5.0, n)
+    fb[~((rng.random(n) > 0.1) & (atts > 0))] = np.nan
+    rsvp = np.where(etype.isin(["Webinar","Workshop","Guest Lecture"]), 1, rng.integers(0, 2, n))
+
+    return typed(pd.DataFrame({
+        "event_id": id_array(rng, n, start),
+        "event_name": etype + " " + num.str.zfill(4) + " • " + theme,
+        "event_type": categorical(EVENT_TYPES, t),
+        "event_theme": categorical(EVENT_THEMES, i % len(EVENT_THEMES)),
+        "event_description": "Join us for " + etype.str.lower() + " on " + theme.str.lower() + ".",
+        "start_datetime": start_dt,
+        "end_datetime": end_dt,
+        "timezone": choice_array(rng, TIMEZONES, n),
+        "delivery_mode": choice_array(rng, EVENT_MODES, n),
+        "location_venue": venue,
+        "location_city": city,
+        "location_state": st,
+        "location_country": country,
+        "organizer_unit": org_unit,
+        "organizer_contact_email": org_email,
+        "capacity": cap,
+        "rsvp_required": rsvp,
+        "registrations_count": regs,
+        "attendees_count": atts,
+        "feedback_score_avg": fb,
+    }), EVENT_SCHEMA)
+
+def make_events_rows(n=ROWS):
+    rows = []
+    base = datetime.combine(date.today(), datetime.min.time())
+    for i in range(1, n+1):
+        etype = EVENT_TYPES[i % len(EVENT_TYPES)]
+        theme = EVENT_THEMES[i % len(EVENT_THEMES)]
+        start = base + timedelta(days=random.randint(-180,179), hours=random.choice([10,14,18]))
+        duration = random.randint(1,4)
+        end = start + timedelta(hours=duration)
+        tz = random.choice(TIMEZONES)
+        venue, city, st, country = random.choice(EVENT_VENUES)
+        org_unit, org_email = random.choice(EVENT_ORGS)
+        cap = { "Career Fair": random.randint(500,1200),
+                "Webinar": random.randint(200,600),
+                "Workshop": random.randint(30,150),
+                "Meetup": random.randint(50,200),
+                "Guest Lecture": random.randint(80,230) }[etype]
+        regs = min(cap, 100 + random.randint(0, 600))
+        atts = min(regs, 80 + random.randint(0, 400))
+        fb = round(random.uniform(3.5,5.0), 2) if random.random() > 0.1 and atts > 0 else ""
+
+        rows.append({
+            "event_id": uid(),
+            "event_name": f"{etype} {i:04d} • {theme}",
+            "event_type": etype,
+            "event_theme": theme,
+            "event_description": f"Join us for {etype.lower()} on {theme.lower()}.",
+            "start_datetime": start.isoformat(sep=' '),
+            "end_datetime": end.isoformat(sep=' '),
+            "timezone": tz,
+            "delivery_mode": random.choice(EVENT_MODES),
+            "location_venue": venue,
+            "location_city": city,
+            "location_state": st,
+            "location_country": country,
+            "organizer_unit": org_unit,
+            "organizer_contact_email": org_email,
+            "capacity": cap,
+            "rsvp_required": 1 if etype in ("Webinar","Workshop","Guest Lecture") else random.choice([0,1]),
+            "registrations_count": regs,
+            "attendees_count": atts,
+            "feedback_score_avg": fb
+        })
+    return pd.DataFrame(rows)
+
+# ---------- 5) alumni_1 (20 cols) ----------
+SKILLS_PRIMARY = ["Python, SQL, Statistics","Java, Algorithms, DS","Git, CI/CD, Microservices","Power BI, Excel, Storytelling","Network Sec, Splunk, IAM","ETL, Databases, Cloud"]
+SKILLS_SECONDARY = ["ML, DL, MLOps","AWS, Azure, GCP","SIEM, SOC","DAX, Modeling, Dashboards","Spark, Hadoop, PySpark","Communication, Teamwork"]
+CERTIFICATIONS = ["AWS CCP","Azure Fundamentals","None","PMP","Security+"]
+ACHIEVEMENTS = ["Dean's List","Hackathon Winner","Published Paper","Volunteer Lead",""]
+PROFILE_VISIBILITY = ["Public","SLU-only","Private"]
+CONTACT_METHODS = ["Email","LinkedIn","Phone"]
+CAREER_STAGES = ["Early","Mid","Senior","Lead"]
+
+ALUMNI_KEYS = ["alumni_id"]
+ALUMNI_SCHEMA = {
+    "current_title": JOB_SCHEMA["job_title"],
+    "years_experience": "float32",
+    "career_stage": category(CAREER_STAGES),
+    "skills_primary": category(SKILLS_PRIMARY),
+    "skills_secondary": category(SKILLS_SECONDARY),
+    "certifications": category(CERTIFICATIONS),
+    "achievements": category(ACHIEVEMENTS),
+    "mentoring_interest": "int8",
+    "volunteering_interest": "int8",
+    "is_active_member": "int8",
+    "last_engagement_date": "datetime64[s]",
+    "profile_visibility": category(PROFILE_VISIBILITY),
+    "preferred_contact_method": category(CONTACT_METHODS),
+    "preferred_time_zone": category(TIMEZONES),
+}
+
+def make_alumni(students_df, jobs_df, n=ROWS, engine=ENGINE):
+    if engine == "rows":
+        return make_alumni_rows(students_df, jobs_df, n)
+    latest = new_latest_jobs(len(students_df))
+    student_idx = pd.Index(students_df["student_id"]).get_indexer(jobs_df["student_id"])
+    update_latest_jobs(latest, jobs_df, student_idx)
+    return concat_chunks(iter_alumni(compact_keys(students_df, STUDENT_KEYS + STUDENT_NAME_KEYS), latest, n))
+
+def new_latest_jobs(n_students):
+    # latest job per student, aligned with the students table
+    return {"start_date": np.full(n_students, np.datetime64("NaT"), dtype="datetime64[D]"),
+            "employer_id": np.zeros(n_students, dtype="S1"),
+            "job_title": np.zeros(n_students, dtype="S1")}
+
+def update_latest_jobs(latest, jobs_df, student_idx):
+    # keyed fold of one jobs chunk: per student keep the job with the latest start_date,
+    # ties going to the later job (same as a stable sort + groupby(...).tail(1))
+    start = pd.to_datetime(jobs_df["start_date"], errors="coerce").to_numpy().astype("datetime64[D]")
+    pos = np.flatnonzero(student_idx >= 0)
+    if len(pos) == 0:
+        return
+    order = np.lexsort((start[pos].view("i8"), student_idx[pos]))
+    sid = student_idx[pos][order]
+    last = pos[order[np.r_[sid[1:] != sid[:-1], True]]]
+    sid = student_idx[last]
+    newer = start[last].view("i8") >= latest["start_date"][sid].view("i8")
+    last, sid = last[newer], sid[newer]
+    latest["start_date"][sid] = start[last]
+    for col, vals in compact_keys(jobs_df.iloc[last], ["employer_id", "job_title"]).items():
+        if vals.dtype.kind != latest[col].dtype.kind:
+            latest[col] = np.full(len(latest[col]), -1, dtype=vals.dtype)   # int ids: -1 = no job
+        elif vals.dtype.itemsize > latest[col].dtype.itemsize:
+            latest[col] = latest[col].astype(vals.dtype)
+        latest[col][sid] = vals
+
+def iter_alumni(stu, latest, n=ROWS, run=run_serial, names=None):
+    # one alumni row for each of the first n students; without name columns in `stu`
+    # they are redrawn per chunk (names: the pools the students were drawn from)
+    n_students = key_rows(stu)
+    n = min(n, n_students)
+    if "first_name" not in stu:
+        names = name_pools() if names is None else names
+    return run((make_alumni_np, (stu, latest, lo, hi, make_rng("alumni", k), n_students, names))
+               for k, lo, hi in chunk_ranges(n))
+
+def make_alumni_np(stu, latest, lo, hi, rng=None, n_students=None, names=None):
+    rng = make_rng("alumni") if rng is None else rng
+    stu, latest = slice_keys(stu, lo, hi), slice_keys(latest, lo, hi)
+    if "first_name" not in stu:
+        stu.update(student_names(lo, hi, n_students, names))
+    n = hi - lo
+    start_dt = latest["start_date"]
+    days = (np.datetime64(TODAY) - start_dt).astype("timedelta64[D]").astype(np.int64)
+    years_exp = np.where(np.isnat(start_dt), 0.0, np.round(days / 365.0, 1))
+    stage = categorical(CAREER_STAGES, np.select([years_exp < 2, years_exp < 5, years_exp < 10], [0, 1, 2], 3))
+    last_eng = days_ago_array(rng, 0, 720, n)
+    last_eng[rng.random(n) >= 0.3] = np.datetime64("NaT")
+    first, last, email = (v if isinstance(v, pd.Series) else from_bytes(v)
+                          for v in (stu["first_name"], stu["last_name"], stu["slu_email"]))
+    handle = clean_email_array(email).str.split("@", n=1).str[0]
+
+    return typed(pd.DataFrame({
+        "alumni_id": id_array(rng, n, lo),
+        "student_id": id_series(stu["student_id"]),
+        "current_employer_id": id_series(latest["employer_id"]),
+        "current_title": from_bytes(latest["job_title"]),
+        "years_experience": years_exp,
+        "career_stage": stage,
+        "skills_primary": choice_array(rng, SKILLS_PRIMARY, n),
+        "skills_secondary": choice_array(rng, SKILLS_SECONDARY, n),
+        "certifications": choice_array(rng, CERTIFICATIONS, n),
+        "achievements": choice_array(rng, ACHIEVEMENTS, n),
+        "mentoring_interest": rng.integers(0, 2, n),
+        "volunteering_interest": rng.integers(0, 2, n),
+        "is_active_member": rng.integers(0, 2, n),
+        "last_engagement_date": last_eng,
+        "profile_visibility": choice_array(rng, PROFILE_VISIBILITY, n),
+        "preferred_contact_method": choice_array(rng, CONTACT_METHODS, n),
+        "preferred_time_zone": choice_array(rng, TIMEZONES, n),
+        "portfolio_url": "https://portfolio.example.com/" + handle,
+        "github_url": "https://github.com/" + first.str[0].str.lower() + last.str.lower(),
+        "created_at": NOW.isoformat(timespec="seconds"),
+    }), ALUMNI_SCHEMA)
+
+def make_alumni_rows(students_df, jobs_df, n=ROWS):
+    jobs_df2 = jobs_df.copy()
+    jobs_df2["start_date_dt"] = pd.to_datetime(jobs_df2["start_date"], errors="coerce" )
+    latest = jobs_df2.sort_values(["student_id","start_date_dt"]).groupby("student_id").tail(1)
+
+    rows = []
+    for _, stu in students_df.iterrows():
+        sid = stu["student_id"]
+        lj = latest[latest["student_id"] == sid]
+        employer_id = lj["employer_id"].iloc[0] if not lj.empty else ""
+        current_title = lj["job_title"].iloc[0] if not lj.empty else ""
+        start_dt = lj["start_date_dt"].iloc[0] if not lj.empty else pd.NaT
+        years_exp = 0.0 if pd.isna(start_dt) else round(((pd.Timestamp.today() - start_dt).days)/365.0, 1)
+
+        stage = "Early" if years_exp < 2 else "Mid" if years_exp < 5 else "Senior" if years_exp < 10 else "Lead"
+
+        rows.append({
+            "alumni_id": uid(),
+            "student_id": sid,
+            "current_employer_id": employer_id,
+            "current_title": current_title,
+            "years_experience": years_exp,
+            "career_stage": stage,
+            "skills_primary": random.choice(SKILLS_PRIMARY),
+            "skills_secondary": random.choice(SKILLS_SECONDARY),
+            "certifications": random.choice(CERTIFICATIONS),
+            "achievements": random.choice(ACHIEVEMENTS),
+            "mentoring_interest": random.choice([0,1]),
+            "volunteering_interest": random.choice([0,1]),
+            "is_active_member": random.choice([0,1]),
+            "last_engagement_date": (date.today() - timedelta(days=random.randint(0,720))).isoformat() if random.random()<0.3 else "",
+            "profile_visibility": random.choice(PROFILE_VISIBILITY),
+            "preferred_contact_method": random.choice(CONTACT_METHODS),
+            "preferred_time_zone": random.choice(TIMEZONES),
+            "portfolio_url": f"https://portfolio.example.com/{clean_email(stu['slu_email']).split('@')[0]}",
+            "github_url": f"https://github.com/{stu['first_name'][0].lower()}{stu['last_name'].lower()}",
+            "created_at": datetime.utcnow().isoformat(timespec="seconds")
+        })
+    df = pd.DataFrame(rows)
+    return df.head(n)
+
+# ---------- 6) event_attendance_1 (20 cols) ----------
+PER_EVENT_CAP = 300
+REGISTRATION_CHANNELS = ["Portal","Email","Onsite"]
+CHECK_IN_METHODS = ["QR","Manual","Import"]
+NO_SHOW_REASONS = ["Sick","Conflict",""]
+PRIVACY_LEVELS = ["Public","Internal","Restricted"]
+ATTENDANCE_SCHEMA = {
+    "registration_status": category(["Registered"]),
+    "registration_channel": category(REGISTRATION_CHANNELS),
+    "registered_at": "datetime64[s]",
+    "attended": "int8",
+    "attended_at": "datetime64[s]",
+    "check_in_method": category(CHECK_IN_METHODS),
+    "feedback_score": "float32",
+    "certificate_issued": "int8",
+    "no_show_reason": category(NO_SHOW_REASONS),
+    "reminder_sent": "int8",
+    "reminder_sent_at": "datetime64[s]",
+    "created_by_user": category(["seed_bot"]),
+    "updated_by_user": category(["seed_bot"]),
+    "privacy_level": category(PRIVACY_LEVELS),
+}
+
+def make_event_attendance(events_df, students_df, n=ROWS, engine=ENGINE, per_event_cap=PER_EVENT_CAP):
+    # n=None keeps every registration (events x min(registrations_count, per_event_cap))
+    if engine == "rows":
+        return make_event_attendance_rows(events_df, students_df, n, per_event_cap)
+    ev = compact_keys(events_df, EVENT_KEYS)
+    return concat_chunks(iter_event_attendance(ev, compact_keys(students_df, ["student_id"]), n, per_event_cap))
+
+def iter_event_attendance(ev, stu, n=ROWS, per_event_cap=PER_EVENT_CAP, run=run_serial, start=0):
+    # events are expanded in groups of about CHUNK_ROWS registrations, each with its own
+    # stream; how many rows each group may contribute is known up front from the counts.
+    # start: attendance rows already written (append mode)
+    regs = np.minimum(resolve_keys(ev)["registrations_count"], min(per_event_cap, key_rows(stu))).clip(0)
+    ranges = list(chunk_ranges(len(regs), max(1, CHUNK_ROWS // max(per_event_cap, 1))))
+    before = np.r_[0, np.cumsum([regs[lo:hi].sum() for _, lo, hi in ranges])]
+    n = int(before[-1]) if n is None else n
+
+    def tasks(limited):
+        for k, lo, hi in ranges:
+            if limited and before[k] >= n:
+                return
+            yield make_event_attendance_np, (ev, stu, lo, hi, make_rng("event_attendance", k, start),
+                                             per_event_cap, n - before[k] if limited else None,
+                                             start + int(before[k]))
+
+    done = 0
+    for df in run(tasks(limited=True)):
+        df = df.head(n - done)
+        done += len(df)
+        if len(df):
+            yield df
+    # too few registrations: repeat the rows produced so far (with fresh ids) up to n
+    pad_rng = make_rng("event_attendance_pad", 0, start)
+    while 0 < done < n:
+        for df in run(tasks(limited=False)):
+            pad = df.head(n - done).copy()
+            pad["attendance_id"] = id_array(pad_rng, len(pad), start + done)
+            done += len(pad)
+            if len(pad):
+                yield pad
+            if done >= n:
+                break
+    if not done:
+        # no registrations to expand: one empty chunk, so the table still has its columns
+        yield from run([(make_event_attendance_np, (ev, stu, 0, 0, make_rng("event_attendance", 0, start),
+                                                    per_event_cap, None, start))])
+
+def sample_distinct(rng, n_pop, sizes):
+    # sizes[k] distinct draws from range(n_pop) for every group k, flattened group by group
+    sizes = np.asarray(sizes, dtype=np.int64)
+    if len(sizes) == 0 or sizes.sum() == 0:
+        return np.empty(0, dtype=np.int64)
+    if n_pop <= 4 * sizes.max():
+        # dense: rank one random key per (group, candidate), keep the first sizes[k] ranks
+        out = []
+        step = max(1, (1 << 22) // n_pop)
+        for lo in range(0, len(sizes), step):
+            sz = sizes[lo:lo + step]
+            order = np.argsort(rng.random((len(sz), n_pop)), axis=1)
+            out.append(order[np.arange(n_pop) < sz[:, None]])
+        return np.concatenate(out)
+    # sparse: draw with replacement, then redraw the (rare) repeats within a group
+    group = np.repeat(np.arange(len(sizes)), sizes)
+    picks = rng.integers(0, n_pop, len(group))
+    while True:
+        key = group * n_pop + picks
+        order = np.argsort(key, kind="stable")
+        dup = np.zeros(len(key), dtype=bool)
+        dup[order[1:]] = key[order[1:]] == key[order[:-1]]
+        if not dup.any():
+            return picks
+        picks[dup] = rng.integers(0, n_pop, int(dup.sum()))
+
+def make_event_attendance_np(ev, stu, lo, hi, rng=None, per_event_cap=PER_EVENT_CAP, limit=None, start=0):
+    rng = make_rng("event_attendance") if rng is None else rng
+    ev = slice_keys(ev, lo, hi)
+    students = stu["student_id"]
+    regs = np.minimum(ev["registrations_count"], min(per_event_cap, len(students))).clip(0)
+    if limit is not None:
+        # only expand as many events as needed to fill `limit` rows
+        regs = regs[:int(np.searchsorted(np.cumsum(regs), limit)) + 1]
+    atts = np.minimum(ev["attendees_count"][:len(regs)], regs)
+    start_ev = ev["start_datetime"][:len(regs)]
+
+    ev_idx = np.repeat(np.arange(len(regs)), regs)
+    total = len(ev_idx)
+    j = np.arange(1, total + 1) - np.repeat(np.cumsum(regs) - regs, regs)   # 1-based rank within event
+    attended = j <= atts[ev_idx]
+    attended_at = start_ev[ev_idx] + (j % 60).astype("timedelta64[m]")
+    attended_at[~attended] = np.datetime64("NaT")
+    feedback = uniform_array(rng, 3.5, 5.0, total)
+    feedback[~(attended & (rng.random(total) > 0.2))] = np.nan
+    check_in = choice_array(rng, CHECK_IN_METHODS, total)
+    check_in[~attended] = np.nan
+    no_show = choice_array(rng, NO_SHOW_REASONS, total)
+    no_show[attended] = np.nan
+
+    return typed(pd.DataFrame({
+        "attendance_id": id_array(rng, total, start),
+        "event_id": id_series(ev["event_id"][ev_idx]),
+        "student_id": id_series(students[sample_distinct(rng, len(students), regs)]),
+        "registration_status": "Registered",
+        "registration_channel": choice_array(rng, REGISTRATION_CHANNELS, total),
+        "registered_at": start_ev[ev_idx] - np.timedelta64(1, "D"),
+        "attended": attended.astype(np.int8),
+        "attended_at": attended_at,
+        "check_in_method": check_in,
+        "feedback_score": feedback,
+        "feedback_comment": "",
+        "certificate_issued": np.zeros(total, dtype=np.int8),
+        "no_show_reason": no_show,
+        "reminder_sent": rng.integers(0, 2, total).astype(np.int8),
+        "reminder_sent_at": start_ev[ev_idx] - np.timedelta64(2, "D"),
+        "created_by_user": "seed_bot",
+        "created_at": NOW.isoformat(sep=' ', timespec="seconds"),
+        "updated_by_user": "seed_bot",
+        "updated_at": "",
+        "privacy_level": choice_array(rng, PRIVACY_LEVELS, total),
+    }), ATTENDANCE_SCHEMA)
+
+def make_event_attendance_rows(events_df, students_df, n=ROWS, per_event_cap=PER_EVENT_CAP):
+    rows = []
+    students = students_df["student_id"].tolist()
+    for _, ev in events_df.iterrows():
+        regs = min(ev["registrations_count"], per_event_cap, len(students))
+        atts = min(ev["attendees_count"], regs)
+        chosen = random.sample(students, int(regs)) if regs > 0 else []
+        for j, sid in enumerate(chosen, start=1):
+            attended = 1 if j <= atts else 0
+            attended_at = (pd.to_datetime(ev["start_datetime"]) + timedelta(minutes=(j % 60))).isoformat(sep=' ') if attended else ""
+            rows.append({
+                "attendance_id": uid(),
+                "event_id": ev["event_id"],
+                "student_id": sid,
+                "registration_status": "Registered",
+                "registration_channel": random.choice(REGISTRATION_CHANNELS),
+                "registered_at": (pd.to_datetime(ev["start_datetime"]) - timedelta(days=1)).isoformat(sep=' '),
+                "attended": attended,
+                "attended_at": attended_at,
+                "check_in_method": random.choice(CHECK_IN_METHODS) if attended else "",
+                "feedback_score": round(random.uniform(3.5,5.0),2) if attended and random.random()>0.2 else "",
+                "feedback_comment": "",
+                "certificate_issued": 0,
+                "no_show_reason": "" if attended else random.choice(NO_SHOW_REASONS),
+                "reminder_sent": random.choice([0,1]),
+                "reminder_sent_at": (pd.to_datetime(ev["start_datetime"]) - timedelta(days=2)).isoformat(sep=' '),
+                "created_by_user": "seed_bot",
+                "created_at": datetime.utcnow().isoformat(sep=' ', timespec="seconds"),
+                "updated_by_user": "seed_bot",
+                "updated_at": "",
+                "privacy_level": random.choice(PRIVACY_LEVELS)
+            })
+    df = pd.DataFrame(rows)
+    n = len(df) if n is None else n
+    if len(df) < n:
+        pad = []
+        for i in range(n - len(df)):
+            r = df.iloc[i % max(1,len(df))].copy()
+            r["attendance_id"] = uid()
+            pad.append(r)
+        df = pd.concat([df, pd.DataFrame(pad)], ignore_index=True)
+    return df.head(n)
+
+# ---------- 7) engagements_1 (20 cols) ----------
+ENGAGEMENT_TYPES = ["Mentorship","Sponsorship","Talk","Donation","Job Post","Volunteering","Workshop","Panel"]
+ENGAGEMENT_SUBTYPES = {
+    "Mentorship":"Career Mentoring","Sponsorship":"Event Sponsor","Talk":"Guest Talk",
+    "Donation":"Alumni Donation","Job Post":"Full-time Role","Volunteering":"Community Service",
+    "Workshop":"Hands-on Session","Panel":"Industry Panel"
+}
+ENGAGEMENT_POINTS = {"Mentorship":10,"Sponsorship":15,"Talk":8,"Donation":20,"Job Post":6,"Volunteering":12,"Workshop":10,"Panel":8}
+# uniform (lo, hi) ranges per engagement type; other types leave the column empty
+ENGAGEMENT_HOURS = {"Mentorship":(1,6),"Talk":(1,3),"Volunteering":(1,6),"Workshop":(1,6)}
+ENGAGEMENT_MONEY = {"Sponsorship":(500,5000),"Donation":(100,3000)}
+ENGAGEMENT_CHANNELS = ["Email","LinkedIn","Handshake","In-person"]
+STATUS_WEIGHTS = [("Completed",8),("Planned",1),("Cancelled",1)]
+pick_status = make_weighted_choice(STATUS_WEIGHTS)
+ENGAGEMENT_SCHEMA = {
+    "engagement_type": category(ENGAGEMENT_TYPES),
+    "engagement_subtype": category(ENGAGEMENT_SUBTYPES[t] for t in ENGAGEMENT_TYPES),
+    "engagement_date": "datetime64[s]",
+    "points_awarded": "int8",
+    "hours_contributed": "float32",
+    "monetary_value_usd": "float32",
+    "channel": category(ENGAGEMENT_CHANNELS),
+    "satisfaction_rating": "float32",
+    "created_by_user": category(["seed_bot"]),
+    "status": category(v for v, _ in STATUS_WEIGHTS),
+    "follow_up_required": "int8",
+    "follow_up_date": "datetime64[s]",
+    "privacy_level": category(PRIVACY_LEVELS),
+}
+
+def make_engagements(alumni_df, employers_df, events_df, n=ROWS, engine=ENGINE):
+    if engine == "rows":
+        return make_engagements_rows(alumni_df, employers_df, events_df, n)
+    al = compact_keys(alumni_df, ALUMNI_KEYS)
+    emp = compact_keys(employers_df, ["employer_id"])
+    return concat_chunks(iter_engagements(al, emp, compact_keys(events_df, EVENT_KEYS), n))
+
+def iter_engagements(al, emp, ev, n=ROWS, run=run_serial, start=0):
+    return run((make_engagements_np, (al, emp, ev, hi - lo, make_rng("engagements", k, start), start + lo))
+               for k, lo, hi in chunk_ranges(n))
+
+def uniform_by_code(rng, codes, values, ranges):
+    # round(uniform(lo, hi), 2) for codes whose value has a range in `ranges`, NaN for the rest
+    lo, hi = (np.array([ranges.get(v, (0, 0))[k] for v in values], dtype=float) for k in (0, 1))
+    out = np.round(rng.uniform(lo[codes], hi[codes]), 2).astype(np.float32)
+    out[~np.isin(codes, [k for k, v in enumerate(values) if v in ranges])] = np.nan
+    return out
+
+def optional_keys(rng, keys, mask):
+    # a random key where mask is set, none elsewhere; also returns the drawn row indices
+    idx = rng.integers(0, max(len(keys), 1), len(mask))
+    mask = mask & (len(keys) > 0)
+    out = np.full(len(mask), b"" if keys.dtype.kind == "S" else -1, dtype=keys.dtype)
+    out[mask] = keys[idx[mask]]
+    return id_series(out), idx, mask
+
+def make_engagements_np(al, emp, ev, n=ROWS, rng=None, start=0):
+    rng = make_rng("engagements") if rng is None else rng
+    i, num = row_numbers(n, start)
+    t = rng.integers(0, len(ENGAGEMENT_TYPES), n)
+
+    # event start dates are read through the sampled event row index, not looked up per row
+    ev_dates = ev["start_datetime"].astype("datetime64[D]")
+    ev_ids, ev_idx, has_event = optional_keys(rng, ev["event_id"], np.isin(i % 5, (0, 1, 2)))
+    emp_ids, _, _ = optional_keys(rng, emp["employer_id"], i % 2 == 0)
+    eng_date = np.datetime64(TODAY) - rng.integers(0, 721, n).astype("timedelta64[D]")
+    eng_date[has_event] = ev_dates[ev_idx[has_event]]
+
+    status = weighted_choice_array(rng, STATUS_WEIGHTS, n)
+    sat = uniform_array(rng, 3.5, 5.0, n)
+    sat[status != "Completed"] = np.nan
+    follow_up = i % 5 == 0
+    al_ids = al["alumni_id"]
+
+    return typed(pd.DataFrame({
+        "engagement_id": id_array(rng, n, start),
+        "alumni_id": id_series(al_ids[rng.integers(0, len(al_ids), n)]),
+        "employer_id": emp_ids,
+        "event_id": ev_ids,
+        "engagement_type": categorical(ENGAGEMENT_TYPES, t),
+        "engagement_subtype": categorical([ENGAGEMENT_SUBTYPES[x] for x in ENGAGEMENT_TYPES], t),
+        "engagement_date": eng_date,
+        "points_awarded": np.array([ENGAGEMENT_POINTS[x] for x in ENGAGEMENT_TYPES], dtype=np.int8)[t],
+        "hours_contributed": uniform_by_code(rng, t, ENGAGEMENT_TYPES, ENGAGEMENT_HOURS),
+        "monetary_value_usd": uniform_by_code(rng, t, ENGAGEMENT_TYPES, ENGAGEMENT_MONEY),
+        "channel": choice_array(rng, ENGAGEMENT_CHANNELS, n),
+        "satisfaction_rating": sat,
+        "remarks": "",
+        "evidence_url": ("https://evidence.example.com/eng/" + num).where(i % 3 == 0, ""),
+        "created_by_user": "seed_bot",
+        "created_at": NOW.isoformat(sep=' ', timespec="seconds"),
+        "status": status,
+        "follow_up_required": follow_up.astype(np.int8),
+        "follow_up_date": np.where(follow_up, eng_date + np.timedelta64(7, "D"), np.datetime64("NaT")),
+        "privacy_level": choice_array(rng, PRIVACY_LEVELS, n),
+    }), ENGAGEMENT_SCHEMA)
+
+def make_engagements_rows(alumni_df, employers_df, events_df, n=ROWS):
+    types = ENGAGEMENT_TYPES
+    subtypes = ENGAGEMENT_SUBTYPES
+    channels = ENGAGEMENT_CHANNELS
+    privs = PRIVACY_LEVELS
+
+    al_ids = alumni_df["alumni_id"].tolist()
+    emp_ids = employers_df["employer_id"].tolist()
+    ev_ids = events_df["event_id"].tolist()
+
+    rows = []
+    for i in range(1, n+1):
+        et = random.choice(types)
+        hours = None
+        if et in ("Mentorship","Talk","Volunteering","Workshop"):
+            hours = round(random.uniform(1,6),2) if et!="Talk" else round(random.uniform(1,3),2)
+        money = None
+        if et in ("Sponsorship","Donation"):
+            money = round(random.uniform(100,3000),2) if et=="Donation" else round(random.uniform(500,5000),2)
+
+        has_event = (i % 5) in (0,1,2)
+        has_emp   = (i % 2) == 0
+
+        ev = random.choice(ev_ids) if has_event and ev_ids else ""
+        emp = random.choice(emp_ids) if has_emp and emp_ids else ""
+
+        ev_row = events_df[events_df["event_id"]==ev].iloc[0] if ev else None
+        eng_date = (pd.to_datetime(ev_row["start_datetime"]).date() if ev_row is not None else (date.today() - timedelta(days=random.randint(0,720))))
+
+        status = pick_status()
+        sat = (round(random.uniform(3.5,5.0),2) if status=="Completed" else "")
+
+        rows.append({
+            "engagement_id": uid(),
+            "alumni_id": random.choice(al_ids),
+            "employer_id": emp,
+            "event_id": ev,
+            "engagement_type": et,
+            "engagement_subtype": subtypes[et],
+            "engagement_date": eng_date.isoformat(),
+            "points_awarded": ENGAGEMENT_POINTS[et],
+            "hours_contributed": hours if hours is not None else "",
+            "monetary_value_usd": money if money is not None else "",
+            "channel": random.choice(channels),
+            "satisfaction_rating": sat,
+            "remarks": "",
+            "evidence_url": f"https://evidence.example.com/eng/{i}" if i % 3 == 0 else "",
+            "created_by_user": "seed_bot",
+            "created_at": datetime.utcnow().isoformat(sep=' ', timespec="seconds"),
+            "status": status,
+            "follow_up_required": 1 if i % 5 == 0 else 0,
+            "follow_up_date": (eng_date + timedelta(days=7)).isoformat() if i % 5 == 0 else "",
+            "privacy_level": random.choice(privs)
+        })
+    return pd.DataFrame(rows)
+
+# ---------- Instrumentation ----------
+# Every table reports table_start / chunk / table_done events to the registered hooks
+# with its row counts, timers, rows/sec and the process RSS. With no hook registered
+# a Stage only keeps a few counters, so the cost is a couple of clock reads per chunk.
+HOOKS = []
+HOOKS_LOCK = threading.Lock()   # table threads report concurrently
+
+def add_hook(fn):
+    # fn(metrics: dict) is called for every event; returns fn so it can be a decorator
+    HOOKS.append(fn)
+    return fn
+
+def remove_hook(fn):
+    HOOKS.remove(fn)
+
+def rss_mb():
+    # current resident set size; peak RSS where /proc is not available
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1e6
+    except (OSError, ValueError):
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+class Stage:
+    # timers and row counters for one table (or the data dictionary)
+    def __init__(self, table, total=None):
+        self.table, self.total = table, total
+        self.rows = self.written = self.chunks = 0
+        self.gen_seconds = self.write_seconds = self.profile_seconds = 0.0
+        self.start = time.perf_counter()
+        self.emit("table_start")
+
+    def timed(self, chunks):
+        # yields the chunks, adding the time spent waiting for each to gen_seconds
+        chunks = iter(chunks)
+        while True:
+            t0 = time.perf_counter()
+            df = next(chunks, None)
+            if df is None:
+                return
+            self.gen_seconds += time.perf_counter() - t0
+            self.rows += len(df)
+            self.chunks += 1
+            self.emit("chunk")
+            yield df
+
+    def wrote(self, rows, seconds):
+        self.written += rows
+        self.write_seconds += seconds
+
+    def profiled(self, seconds):
+        # time spent folding rows into the data dictionary, kept out of write_s
+        self.profile_seconds += seconds
+
+    def done(self):
+        self.emit("table_done")
+
+    def emit(self, event):
+        if not HOOKS:
+            return
+        elapsed = time.perf_counter() - self.start
+        metrics = {
+            "event": event,
+            "table": self.table,
+            "rows": self.rows,
+            "total_rows": self.total,
+            "written_rows": self.written,
+            "chunks": self.chunks,
+            "elapsed_s": round(elapsed, 3),
+            "generate_s": round(self.gen_seconds, 3),
+            "write_s": round(self.write_seconds, 3),
+            "profile_s": round(self.profile_seconds, 3),
+            "rows_per_sec": round(self.rows / elapsed) if elapsed > 0 else None,
+            "rss_mb": round(rss_mb(), 1),
+        }
+        with HOOKS_LOCK:
+            for hook in HOOKS:
+                hook(metrics)
+
+class JsonLog:
+    # hook: one JSON object per event
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stderr
+
+    def __call__(self, metrics):
+        self.stream.write(json.dumps(metrics) + "\n")
+        self.stream.flush()
+
+class Progress:
+    # hook: one status line for all running tables, redrawn in place on a terminal
+    # and printed once per event otherwise
+    def __init__(self, stream=None):
+        self.stream = stream or sys.stderr
+        self.tty = self.stream.isatty()
+        self.running = {}
+
+    def __call__(self, m):
+        if m["event"] == "table_done":
+            self.running.pop(m["table"], None)
+            line = (f"{m['table']}: {m['rows']:,} rows in {m['elapsed_s']:.1f}s "
+                    f"({m['rows_per_sec'] or 0:,} rows/s), RSS {m['rss_mb']:,.0f} MB")
+            self.stream.write(("\r\x1b[K" if self.tty else "") + line + "\n")
+        else:
+            self.running[m["table"]] = m
+            parts = [f"{t} {r['rows'] / r['total_rows']:4.0%}" if r["total_rows"] else f"{t} {r['rows']:,}"
+                     for t, r in self.running.items()]
+            line = " | ".join(parts) + f" | RSS {m['rss_mb']:,.0f} MB"
+            if self.tty:
+                self.stream.write("\r\x1b[K" + line)
+            elif m["event"] == "chunk":
+                self.stream.write(line + "\n")
+        self.stream.flush()
+
+# ---------- Scale ----------
+# Row counts per table. Every table defaults to --rows; a fan-out ratio, when set,
+# sizes a child table from its parent instead, and registrants_per_event caps how
+# many registrations of each event are expanded into event_attendance rows.
+SCALE_TABLES = ["students", "employers", "jobs", "events", "alumni", "event_attendance", "engagements"]
+FANOUTS = {
+    "jobs_per_student": ("jobs", "students"),
+    "engagements_per_alumnus": ("engagements", "alumni"),
+}
+# tables whose rows each draw a row of these parents (engagements' employer and event are optional)
+REQUIRED_PARENTS = {
+    "jobs": ["students", "employers"],
+    "event_attendance": ["events", "students"],
+    "engagements": ["alumni"],
+}
+
+def table_sizes(n=ROWS, rows=None, jobs_per_student=None, engagements_per_alumnus=None,
+                registrants_per_event=None):
+    # -> {table: rows} plus "registrants_per_event". event_attendance is None when
+    # every registration should be kept (a ratio given, but no explicit row count).
+    rows = dict(rows or {})
+    unknown = set(rows) - set(SCALE_TABLES)
+    if unknown:
+        raise ValueError(f"unknown table(s): {', '.join(sorted(unknown))}")
+    sizes = {t: int(rows.get(t, n)) for t in SCALE_TABLES}
+    sizes["alumni"] = min(sizes["alumni"], sizes["students"])   # one alumni row per student
+    ratios = {"jobs_per_student": jobs_per_student, "engagements_per_alumnus": engagements_per_alumnus}
+    for ratio, (child, parent) in FANOUTS.items():
+        if ratios[ratio] is not None and child not in rows:
+            sizes[child] = round(sizes[parent] * ratios[ratio])
+    if registrants_per_event is not None and "event_attendance" not in rows:
+        sizes["event_attendance"] = None
+    sizes["registrants_per_event"] = PER_EVENT_CAP if registrants_per_event is None else int(registrants_per_event)
+    if any(v is not None and v < 0 for v in sizes.values()):
+        raise ValueError("row counts and ratios must not be negative")
+    for child, parents in REQUIRED_PARENTS.items():
+        for parent in parents:
+            if sizes[child] and not sizes[parent]:
+                raise ValueError(f"{child} needs at least one {parent} row; set {child}=0 as well")
+    return sizes
+
+def load_config(path):
+    # JSON or TOML file of option defaults, keyed like the long options, e.g.
+    #   {"rows": 1000, "table_rows": {"students": 200000, "employers": 5000},
+    #    "jobs_per_student": 1.5, "registrants_per_event": 200}
+    with open(path, "rb") as fh:
+        if path.endswith(".toml"):
+            import tomllib
+            config = tomllib.load(fh)
+        else:
+            config = json.load(fh)
+    return {k.replace("-", "_"): v for k, v in config.items()}
+
+def table_rows_arg(text):
+    name, _, count = text.partition("=")
+    if name not in SCALE_TABLES or not count.isdigit():
+        raise argparse.ArgumentTypeError(f"expected TABLE=N with TABLE one of {', '.join(SCALE_TABLES)}")
+    return name, int(count)
+
+# ---------- Generation pipeline ----------
+
+def output_files(fmt="csv", profile=False):
+    return [f"{t}.{fmt}" for t in TABLE_NAMES + ["data_dictionary"]] + ([PROFILE_FILE] if profile else [])
+
+def open_table(name, out_dir, fmt="csv", sink=None, append=False):
+    if sink is not None:
+        return sink.writer(name)
+    return open_writer(os.path.join(out_dir, f"{name}.{fmt}"), fmt, append)
+
+def write_whole_table(df, name, out_dir, fmt="csv", sink=None):
+    writer = open_table(name, out_dir, fmt, sink)
+    try:
+        writer.write(df)
+    finally:
+        writer.close()
+
+def write_table(name, chunks, out_dir, chunked, entries, key_cols=(), fmt="csv", total=None, sink=None,
+                append=False):
+    # writes one table and returns its compact key columns for the dependent tables.
+    # chunked: each chunk is appended to the output file as soon as it is produced.
+    # append: the chunks extend an existing file (always written chunked).
+    chunked = chunked or append
+    stage = Stage(name, total)
+    keys, frames = [], []
+    writer = open_table(name, out_dir, fmt, sink, append) if chunked else None
+    try:
+        for df in stage.timed(chunks):
+            keys.append(compact_keys(df, key_cols))
+            if chunked:
+                t0 = time.perf_counter()
+                update_data_dictionary(entries, name, df)
+                t1 = time.perf_counter()
+                writer.write(df)
+                stage.profiled(t1 - t0)
+                stage.wrote(len(df), time.perf_counter() - t1)
+            else:
+                frames.append(df)
+    finally:
+        if writer is not None:
+            writer.close()
+    if not chunked:
+        t0 = time.perf_counter()
+        df = concat_chunks(frames)   # assembling the table counts as generating it
+        t1 = time.perf_counter()
+        update_data_dictionary(entries, name, df)
+        t2 = time.perf_counter()
+        write_whole_table(df, name, out_dir, fmt, sink)
+        stage.gen_seconds += t1 - t0
+        stage.profiled(t2 - t1)
+        stage.wrote(len(df), time.perf_counter() - t2)
+    stage.done()
+    return concat_keys(keys)
+
+def write_whole(name, build, out_dir, fmt="csv", total=None, sink=None):
+    # build() one whole table (data dictionary, rows engine) and write it as a
+    # single-chunk stage; returns the table
+    stage = Stage(name, total)
+    df = next(stage.timed(build() for _ in range(1)))
+    t0 = time.perf_counter()
+    write_whole_table(df, name, out_dir, fmt, sink)
+    stage.wrote(len(df), time.perf_counter() - t0)
+    stage.done()
+    return df
+
+def generate(n=ROWS, out_dir=".", chunked=False, workers=1, fmt="csv", sizes=None, sink=None, profile=False):
+    # students/employers/events start together; every other table starts as soon as
+    # the key arrays of its parents are ready. With workers > 1 the chunks of all
+    # running tables share one process pool. sizes: see table_sizes (default: n each).
+    # profile=True also saves PROFILE_FILE, which append() needs.
+    sizes = table_sizes(n) if sizes is None else sizes
+    dd = {name: {} for name in TABLE_NAMES}
+    with ExitStack() as stack:
+        if workers > 1:
+            import tempfile
+            from concurrent.futures import ProcessPoolExecutor
+            tmp_dir = stack.enter_context(tempfile.TemporaryDirectory())
+            stack.callback(release_keys, tmp_dir)   # runs after the pools shut down
+            pool = stack.enter_context(ProcessPoolExecutor(workers, initializer=init_worker,
+                                                           initargs=(NOW.isoformat(), ID_MODE)))
+            pool.submit(int).result()   # fork the workers now, before the table threads exist
+            tables = stack.enter_context(ThreadPoolExecutor(len(TABLE_NAMES)))
+            run = lambda tasks: run_pool(pool, tasks, window=2 * workers)
+            share = lambda name, keys: share_keys(tmp_dir, name, keys)
+        else:
+            tables, run, share = SerialExecutor(), run_serial, lambda name, keys: keys
+
+        def table(name, chunks, key_cols=()):
+            total = sizes[name[:-2]]
+            return share(name, write_table(name, chunks, out_dir, chunked, dd[name], key_cols, fmt, total, sink))
+
+        def jobs():
+            latest = new_latest_jobs(key_rows(stu.result()))
+            table("jobs_1", iter_jobs(stu.result(), emp.result(), sizes["jobs"], latest, run))
+            return share("latest_jobs", latest)
+
+        stu = tables.submit(lambda: table("students_1", iter_students(sizes["students"], run), STUDENT_KEYS))
+        emp = tables.submit(lambda: table("employers_1", iter_employers(sizes["employers"], run), EMPLOYER_KEYS))
+        ev = tables.submit(lambda: table("events_1", iter_events(sizes["events"], run), EVENT_KEYS))
+        latest = tables.submit(jobs)
+        al = tables.submit(lambda: table("alumni_1", iter_alumni(stu.result(), latest.result(),
+                                                                 sizes["alumni"], run), ALUMNI_KEYS))
+        att = tables.submit(lambda: table("event_attendance_1", iter_event_attendance(
+            ev.result(), stu.result(), sizes["event_attendance"], sizes["registrants_per_event"], run)))
+        eng = tables.submit(lambda: table("engagements_1", iter_engagements(
+            al.result(), emp.result(), ev.result(), sizes["engagements"], run)))
+        for f in (stu, emp, ev, latest, al, att, eng):
+            f.result()
+    write_whole("data_dictionary", lambda: data_dictionary_frame(dd), out_dir, fmt, sink=sink)
+    if profile and sink is None:
+        save_profile(dd, os.path.join(out_dir, PROFILE_FILE))
+
+def generate_rows(n=ROWS, out_dir=".", fmt="csv", sizes=None, sink=None, profile=False):
+    # original engine: whole tables in memory
+    sizes = table_sizes(n) if sizes is None else sizes
+    t = {}
+    def table(name, build):
+        t[name] = write_whole(name, build, out_dir, fmt, sizes[name[:-2]], sink)
+        return t[name]
+
+    students = table("students_1", lambda: make_students(sizes["students"], engine="rows"))
+    employers = table("employers_1", lambda: make_employers(sizes["employers"], engine="rows"))
+    jobs = table("jobs_1", lambda: make_jobs(students, employers, sizes["jobs"], engine="rows"))
+    events = table("events_1", lambda: make_events(sizes["events"], engine="rows"))
+    alumni = table("alumni_1", lambda: make_alumni(students, jobs, sizes["alumni"], engine="rows"))
+    table("event_attendance_1", lambda: make_event_attendance(events, students, sizes["event_attendance"], engine="rows",
+                                                              per_event_cap=sizes["registrants_per_event"]))
+    table("engagements_1", lambda: make_engagements(alumni, employers, events, sizes["engagements"],
+                                                    engine="rows"))
+    dd = {}
+    def dictionary():
+        dd.update(profile_tables(t))
+        return data_dictionary_frame(dd)
+    write_whole("data_dictionary", dictionary, out_dir, fmt, sink=sink)
+    if profile and sink is None:
+        save_profile(dd, os.path.join(out_dir, PROFILE_FILE))
+
+# ---------- Append ----------
+# --append TABLE=N adds N rows to tables of an existing output directory. Only key
+# columns of the existing files are read: the parents the new rows point at, and the
+# primary keys that tell where row numbers and ids continue. New rows draw from
+# streams of their own (make_rng(..., start)) and the data dictionary is updated from
+# its saved profile (written by generate(..., profile=True) / --save-profile), so a
+# top-up costs time in proportion to the rows it adds. The existing key columns it
+# reads are held in memory: the parents' keys, and every event_id of event_attendance
+# or engagement_id of engagements when those tables are extended.
+# event_attendance rows go to events that have no attendance yet (new events included);
+# jobs and alumni are derived from whole parent tables and can't be appended to.
+APPEND_TABLES = ["students", "employers", "events", "event_attendance", "engagements"]
+
+def append_rows_arg(text):
+    name, count = table_rows_arg(text)
+    if name not in APPEND_TABLES:
+        raise argparse.ArgumentTypeError(f"can't append to {name}; expected one of {', '.join(APPEND_TABLES)}")
+    return name, count
+
+def existing_id_mode(out_dir=".", fmt="csv"):
+    # "int" when the existing tables are keyed by row numbers, else "uuid"
+    for table in TABLE_NAMES:
+        path = os.path.join(out_dir, f"{table}.{fmt}")
+        if os.path.exists(path):
+            pk = PRIMARY_KEYS[table]
+            keys = next(read_keys(path, table, [pk]), pd.DataFrame({pk: []}))[pk]
+            if len(keys):   # empty tables don't tell
+                return "int" if keys.str.fullmatch(r"\d+").all() else "uuid"
+    return ID_MODE
+
+def load_table_keys(path, table, cols):
+    # compact key columns (see compact_keys) of an existing output file, read in chunks;
+    # an empty table gives zero-length columns
+    parts = []
+    empty = pd.DataFrame({c: pd.Series(dtype="string") for c in cols})
+    for df in itertools.chain(read_keys(path, table, cols), [empty]):
+        if parts and df is empty:
+            break
+        for c in cols:
+            if c.endswith("_id") and ID_MODE == "int":
+                df[c] = pd.to_numeric(df[c].mask(df[c] == "")).fillna(-1).astype(np.int64)
+            elif not c.endswith(("_id", "_datetime")):
+                df[c] = pd.to_numeric(df[c])
+        parts.append(compact_keys(df, cols))
+    return concat_keys(parts)
+
+def next_row(keys, pk):
+    # rows already in a table (or its largest int id): new rows are numbered after it
+    ids = keys[pk]
+    return max(len(ids), int(ids.max())) if ids.dtype.kind == "i" and len(ids) else len(ids)
+
+def append(rows, out_dir=".", fmt="csv", per_event_cap=PER_EVENT_CAP):
+    # rows: {table: n} for APPEND_TABLES; returns {table name: rows written}
+    rows = {t: n for t, n in rows.items() if n}
+    if not fmt.startswith("csv"):
+        raise ValueError(f"can't append to {fmt} files; use a csv format")
+    needs = {"students": ["students"], "employers": ["employers"], "events": ["events"],
+             "event_attendance": ["students", "events", "event_attendance"],
+             "engagements": ["employers", "events", "alumni", "engagements"]}
+    paths = {t: os.path.join(out_dir, f"{t}_1.{fmt}") for t in SCALE_TABLES}
+    profile = os.path.join(out_dir, PROFILE_FILE)
+    for path in [paths[t] for table in rows for t in needs[table]] + [profile]:
+        if not os.path.exists(path):
+            raise ValueError(f"{path} not found; --append extends the output of an earlier run "
+                             "made with --save-profile")
+    dd = load_profile(profile)
+    keys, added = {}, {}
+
+    def existing(table, cols):
+        if table not in keys:
+            keys[table] = load_table_keys(paths[table], f"{table}_1", cols)
+        return keys[table]
+
+    def extend(table, chunks, key_cols):
+        # append the chunks to the table's file; returns their key columns
+        name = f"{table}_1"
+        new = write_table(name, chunks, out_dir, True, dd[name], key_cols, fmt, rows[table], append=True)
+        added[name] = key_rows(new)
+        return new
+
+    # students, employers and events first: the tables after them draw from old and new rows
+    if "students" in rows:
+        stu = existing("students", ["student_id"])
+        new = extend("students", iter_students(rows["students"], start=next_row(stu, "student_id")), ["student_id"])
+        keys["students"] = concat_keys([stu, new])
+    if "employers" in rows:
+        emp = existing("employers", ["employer_id"])
+        new = extend("employers", iter_employers(rows["employers"], start=next_row(emp, "employer_id")),
+                     ["employer_id"])
+        keys["employers"] = concat_keys([emp, new])
+    if "events" in rows:
+        ev = existing("events", EVENT_KEYS)
+        new = extend("events", iter_events(rows["events"], start=next_row(ev, "event_id")), EVENT_KEYS)
+        keys["events"] = concat_keys([ev, new])
+    if "event_attendance" in rows:
+        ev, att = existing("events", EVENT_KEYS), existing("event_attendance", ["attendance_id", "event_id"])
+        open_events = ~np.isin(ev["event_id"], att["event_id"])
+        extend("event_attendance", iter_event_attendance(
+            {c: v[open_events] for c, v in ev.items()},
+            existing("students", ["student_id"]), rows["event_attendance"], per_event_cap,
+            start=next_row(att, "attendance_id")), ["attendance_id"])
+    if "engagements" in rows:
+        eng = existing("engagements", ["engagement_id"])
+        extend("engagements", iter_engagements(
+            existing("alumni", ALUMNI_KEYS), existing("employers", ["employer_id"]), existing("events", EVENT_KEYS),
+            rows["engagements"], start=next_row(eng, "engagement_id")), ["engagement_id"])
+
+    write_whole("data_dictionary", lambda: data_dictionary_frame(dd), out_dir, fmt)
+    save_profile(dd, profile)
+    return added
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Generate the SLU alumni synthetic CSV tables.")
+    ap.add_argument("--config", metavar="FILE",
+                    help="JSON/TOML file of option defaults (e.g. table_rows, ratios); flags override it")
+    ap.add_argument("--rows", type=int, default=ROWS, help="rows per table (default: %(default)s)")
+    ap.add_argument("--table-rows", type=table_rows_arg, nargs="+", metavar="TABLE=N",
+                    help=f"row count for single tables ({', '.join(SCALE_TABLES)})")
+    ap.add_argument("--jobs-per-student", type=float, help="size jobs as students x RATIO")
+    ap.add_argument("--engagements-per-alumnus", type=float, help="size engagements as alumni x RATIO")
+    ap.add_argument("--registrants-per-event", type=int,
+                    help=f"expand at most N registrations per event (default: {PER_EVENT_CAP}); "
+                         "event_attendance then keeps every registration unless its row count is set")
+    ap.add_argument("--engine", choices=["numpy", "rows"], default=ENGINE)
+    ap.add_argument("--chunked", action="store_true",
+                    help=f"append each {CHUNK_ROWS:,}-row chunk to disk as it is produced; memory then "
+                         "grows only with the parents' key columns (~300 bytes per student, employer, "
+                         "event and alumni row)")
+    ap.add_argument("--workers", type=int, default=1,
+                    help="worker processes for chunk generation (output does not depend on it)")
+    ap.add_argument("--format", choices=FORMATS, default="csv",
+                    help="output file format (default: %(default)s)")
+    ap.add_argument("--out-dir", default=".", help="directory for the output files (default: current)")
+    ap.add_argument("--sink", metavar="DB:PATH",
+                    help="load the tables into sqlite:PATH or duckdb:PATH instead of writing files; "
+                         "tables of the same names already in the database are dropped and replaced")
+    ap.add_argument("--append", type=append_rows_arg, nargs="+", metavar="TABLE=N",
+                    help=f"add N rows to the tables already in --out-dir ({', '.join(APPEND_TABLES)}) "
+                         "instead of generating every table; needs a run made with --save-profile. The "
+                         "existing tables' key columns it draws on are loaded into memory, including all "
+                         "of event_attendance's attendance/event ids and engagements' engagement ids")
+    ap.add_argument("--save-profile", action="store_true",
+                    help=f"also save {PROFILE_FILE}, the column profile --append updates the data "
+                         "dictionary from (often larger than a small run's tables)")
+    ap.add_argument("--validate", action="store_true",
+                    help="check primary/foreign keys of the written files afterwards (exit 1 on violations)")
+    ap.add_argument("--progress", action="store_true", help="show per-table progress on stderr")
+    ap.add_argument("--log-json", nargs="?", const="-", metavar="FILE",
+                    help="write one JSON line per table event to FILE (default: stderr)")
+    ap.add_argument("--as-of", help="ISO timestamp used as 'now', for reproducible output")
+    ap.add_argument("--name-cache", metavar="DIR",
+                    help="cache the Faker name tables here, keyed by locale and Faker version")
+    ap.add_argument("--id-mode", choices=["uuid", "int"], default=ID_MODE,
+                    help="primary keys: seeded uuid4-style text, or int64 row numbers "
+                         "(numpy engine only; --engine rows writes uuid keys)")
+    pre, _ = ap.parse_known_args(argv)
+    config = load_config(pre.config) if pre.config else {}
+    unknown = set(config) - set(vars(pre))
+    if unknown:
+        ap.error(f"unknown option(s) in {pre.config}: {', '.join(sorted(unknown))}")
+    ap.set_defaults(**config)
+    args = ap.parse_args(argv)
+    # --table-rows adds to the config file's table_rows rather than replacing them
+    args.table_rows = {**dict(config.get("table_rows") or {}), **dict(args.table_rows or [])}
+    return args
+
+def main(argv=None):
+    global NAME_CACHE_DIR
+    args = parse_args(argv)
+    if args.as_of:
+        set_clock(args.as_of)
+    set_id_mode(args.id_mode)
+    NAME_CACHE_DIR = args.name_cache
+    try:
+        sizes = table_sizes(args.rows, args.table_rows, args.jobs_per_student,
+                            args.engagements_per_alumnus, args.registrants_per_event)
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+    # option combinations are checked before the sink is opened (that drops its tables)
+    if args.validate and args.sink:
+        sys.exit("error: --validate checks written files; the --sink database enforces its keys on load")
+    if args.save_profile and args.sink:
+        sys.exit("error: --save-profile saves next to written files; it can't be used with --sink")
+    if args.append and (args.sink or args.engine == "rows"):
+        sys.exit("error: --append works on files from the numpy engine (no --sink, --engine rows)")
+    if args.engine == "rows" and args.chunked:
+        sys.exit("error: --chunked needs the numpy engine; --engine rows builds whole tables in memory")
+    if args.engine == "rows" and args.workers > 1:
+        sys.exit("error: --workers needs the numpy engine; --engine rows runs in one process")
+    if args.engine == "rows" and args.id_mode != "uuid":
+        sys.exit("error: --id-mode int needs the numpy engine; --engine rows always writes uuid keys")
+    if args.engine == "rows" and any(sizes[t] == 0 for t in SCALE_TABLES):
+        sys.exit("error: --engine rows can't write empty tables; use the numpy engine for row counts of 0")
+    try:
+        sink = open_sink(args.sink) if args.sink else None
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+    if sink is None and not args.append:
+        os.makedirs(args.out_dir, exist_ok=True)
+    with ExitStack() as stack:
+        if args.progress:
+            stack.callback(remove_hook, add_hook(Progress()))
+        if args.log_json:
+            log = sys.stderr if args.log_json == "-" else stack.enter_context(open(args.log_json, "a"))
+            stack.callback(remove_hook, add_hook(JsonLog(log)))
+        if args.append:
+            # new ids follow the existing keys, whatever --id-mode says
+            set_id_mode(existing_id_mode(args.out_dir, args.format))
+            try:
+                added = append(dict(args.append), args.out_dir, args.format, sizes["registrants_per_event"])
+            except ValueError as e:
+                sys.exit(f"error: {e}")
+        elif args.engine == "rows":
+            generate_rows(args.rows, args.out_dir, args.format, sizes, sink, args.save_profile)
+        else:
+            generate(args.rows, args.out_dir, args.chunked, args.workers, args.format, sizes, sink,
+                     args.save_profile)
+
+    if sink is not None:
+        print(f"Loaded into {args.sink}:")
+        for name, (rows, seconds) in sink.finish().items():
+            what = f"{rows:,} rows" if name != "indexes" else f"{rows} built"
+            rate = f" ({rows / seconds:,.0f} rows/s)" if name != "indexes" and seconds else ""
+            print(f" - {name}: {what} in {seconds:.2f}s{rate}")
+        return
+    if args.append:
+        print("Appended rows:")
+        for name, rows in added.items():
+            print(f" - {name}.{args.format}: {rows:,} rows")
+        print(f" - data_dictionary.{args.format}, {PROFILE_FILE} updated")
+    else:
+        print("Generated files:" if args.format != "csv" else "Generated CSVs:")
+        for fn in output_files(args.format, args.save_profile):
+            print(" -", fn)
+    if args.validate:
+        results = check_references({t: os.path.join(args.out_dir, f"{t}.{args.format}") for t in TABLE_NAMES})
+        bad = results[results["violations"] > 0]
+        print(f"Key check: {len(results)} checks, {len(bad)} with violations")
+        if len(bad):
+            print(bad.to_string(index=False))
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
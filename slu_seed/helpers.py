@@ -0,0 +1,44 @@
+# SLU Alumni Project — per-row helpers
+# uid / weighted_choice / rand_phone / clean_email as used by the rows engine. Standard
+# library only, so scripts that need just these don't pay for pandas, numpy or Faker.
+
+import bisect
+import itertools
+import random
+import uuid
+
+SEED = 20251024
+random.seed(SEED)
+# ids for the rows engine get their own seeded stream, so they repeat from run to run
+# without shifting the values drawn from `random`
+id_random = random.Random(SEED)
+
+def uid():
+    return str(uuid.UUID(int=id_random.getrandbits(128), version=4))
+
+def weighted_choice(pairs):
+    total = sum(w for _, w in pairs)
+    r = random.uniform(0, total)
+    upto = 0
+    for v, w in pairs:
+        if upto + w >= r:
+            return v
+        upto += w
+    return pairs[-1][0]
+
+def make_weighted_choice(pairs):
+    # weighted_choice for a fixed (value, weight) list: the cumulative weights are worked
+    # out once, and each draw bisects them for the same first value whose running
+    # weight reaches r
+    values = [v for v, _ in pairs]
+    cum = list(itertools.accumulate(w for _, w in pairs))
+    def choice():
+        i = bisect.bisect_left(cum, random.uniform(0, cum[-1]))
+        return values[min(i, len(values) - 1)]
+    return choice
+
+def rand_phone():
+    return f"+1{random.randint(200,999)}{random.randint(200,999)}{random.randint(1000,9999)}"
+
+def clean_email(s):
+    return s.lower().replace(' ', '')
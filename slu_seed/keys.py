@@ -0,0 +1,21 @@
+# SLU Alumni Project — table names and keys
+# The generated tables in parent-first order, their primary keys and the foreign keys
+# between them; shared by the generator, the database sinks and the key checks.
+
+TABLE_NAMES = ["students_1","employers_1","jobs_1","events_1","alumni_1","event_attendance_1","engagements_1"]
+PRIMARY_KEYS = {
+    "students_1": "student_id", "employers_1": "employer_id", "jobs_1": "job_id", "events_1": "event_id",
+    "alumni_1": "alumni_id", "event_attendance_1": "attendance_id", "engagements_1": "engagement_id",
+}
+# (child table, column) -> parent table; the parent column is the parent's primary key
+FOREIGN_KEYS = {
+    ("jobs_1", "student_id"): "students_1",
+    ("jobs_1", "employer_id"): "employers_1",
+    ("alumni_1", "student_id"): "students_1",
+    ("alumni_1", "current_employer_id"): "employers_1",
+    ("event_attendance_1", "event_id"): "events_1",
+    ("event_attendance_1", "student_id"): "students_1",
+    ("engagements_1", "alumni_id"): "alumni_1",
+    ("engagements_1", "employer_id"): "employers_1",
+    ("engagements_1", "event_id"): "events_1",
+}
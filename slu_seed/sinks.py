@@ -0,0 +1,186 @@
+# SLU Alumni Project — database sinks
+# --sink sqlite:PATH / duckdb:PATH loads the tables into a database instead of writing
+# files. Each table is created from the dtypes of its first chunk with its primary and
+# foreign keys, every chunk goes in as one transaction (SQLite: executemany batches of
+# SQL_BATCH_ROWS, DuckDB: one INSERT ... SELECT over the whole chunk), and the
+# secondary indexes are built once all tables are loaded. Tables of the same names
+# already in the database are dropped first.
+
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from .keys import FOREIGN_KEYS, PRIMARY_KEYS, TABLE_NAMES
+
+SINKS = ["sqlite", "duckdb"]
+SQL_BATCH_ROWS = 10_000
+SQL_INDEXES = list(FOREIGN_KEYS) + [
+    ("events_1", "start_datetime"),
+    ("event_attendance_1", "registered_at"),
+    ("engagements_1", "engagement_date"),
+]
+
+def sql_values(s):
+    # one column as DB-API values: dates as ISO text, None for NaN/NaT/""
+    if s.dtype.kind == "M":
+        s = s.dt.strftime("%Y-%m-%d" if s.name.endswith("_date") else "%Y-%m-%d %H:%M:%S")
+    elif s.dtype == np.float32:
+        s = s.astype(str).astype(np.float64)   # the shortest decimal, as written to the CSV
+    out = s.to_numpy(dtype=object, copy=True)
+    out[pd.isna(s).to_numpy()] = None
+    out[out == ""] = None
+    return out
+
+class SqlSink:
+    # one connection shared by the table threads; the lock keeps each chunk's
+    # transaction whole. Parents are always fully loaded before their children start.
+    dialect = None
+
+    def __init__(self, path):
+        self.path = path
+        self.con = self.connect(path)
+        self.lock = threading.Lock()
+        self.columns, self.stats = {}, {}
+        for name in reversed(TABLE_NAMES + ["data_dictionary"]):   # children before parents
+            self.con.execute(f'DROP TABLE IF EXISTS "{name}"')
+
+    def writer(self, name):
+        return SqlWriter(self, name)
+
+    def create(self, name, df):
+        cols = [f'"{c}" {self.sql_type(df[c])}' for c in df.columns]
+        if name in PRIMARY_KEYS:
+            cols.append(f'PRIMARY KEY ("{PRIMARY_KEYS[name]}")')
+        cols += [f'FOREIGN KEY ("{c}") REFERENCES "{parent}" ("{PRIMARY_KEYS[parent]}")'
+                 for (t, c), parent in FOREIGN_KEYS.items() if t == name]
+        self.con.execute(f'CREATE TABLE "{name}" ({", ".join(cols)})')
+        self.columns[name] = {c: self.sql_type(df[c]) for c in df.columns}
+
+    def load(self, name, df):
+        with self.lock:
+            t0 = time.perf_counter()
+            if name not in self.columns:
+                self.create(name, df)
+            self.insert(name, df)
+            rows, seconds = self.stats.get(name, (0, 0.0))
+            self.stats[name] = (rows + len(df), seconds + time.perf_counter() - t0)
+
+    def finish(self):
+        # secondary indexes after the load, then per-table throughput as (rows, seconds)
+        t0 = time.perf_counter()
+        for table, col in SQL_INDEXES:
+            if table in self.columns:
+                self.con.execute(f'CREATE INDEX "ix_{table}_{col}" ON "{table}" ("{col}")')
+        self.commit()
+        seconds = time.perf_counter() - t0
+        self.con.close()
+        stats = {t: self.stats[t] for t in TABLE_NAMES + ["data_dictionary"] if t in self.stats}
+        stats["indexes"] = (len(SQL_INDEXES), seconds)
+        return stats
+
+class SqliteSink(SqlSink):
+    dialect = "sqlite"
+
+    def connect(self, path):
+        import sqlite3
+        con = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        con.execute("PRAGMA journal_mode=WAL")
+        con.execute("PRAGMA synchronous=OFF")   # a seed database: rebuilt, never recovered
+        con.execute("PRAGMA foreign_keys=ON")
+        return con
+
+    def sql_type(self, s):
+        if s.dtype.kind in "biu" or isinstance(s.dtype, pd.Int64Dtype):
+            return "INTEGER"   # an INTEGER primary key is the rowid itself
+        if s.dtype.kind == "f":
+            return "REAL"
+        if s.dtype.kind == "M":
+            return "DATE" if s.name.endswith("_date") else "TIMESTAMP"
+        return "TEXT"
+
+    def insert(self, name, df):
+        rows = list(zip(*(sql_values(df[c]) for c in df.columns)))
+        sql = f'INSERT INTO "{name}" VALUES ({", ".join("?" * len(df.columns))})'
+        self.con.execute("BEGIN")
+        try:
+            for lo in range(0, len(rows), SQL_BATCH_ROWS):
+                self.con.executemany(sql, rows[lo:lo + SQL_BATCH_ROWS])
+        except BaseException:
+            self.con.execute("ROLLBACK")
+            raise
+        self.con.execute("COMMIT")
+
+    def commit(self):
+        pass   # autocommit outside the per-chunk transactions
+
+class DuckdbSink(SqlSink):
+    dialect = "duckdb"
+
+    def connect(self, path):
+        try:
+            import duckdb
+        except ImportError as e:
+            raise ImportError("--sink duckdb needs duckdb (pip install duckdb)") from e
+        try:
+            import pyarrow   # scanning an Arrow table skips pandas' per-column conversion
+            self.arrow = pyarrow
+        except ImportError:
+            self.arrow = None
+        return duckdb.connect(path)
+
+    def sql_type(self, s):
+        if s.dtype.kind in "biu" or isinstance(s.dtype, pd.Int64Dtype):
+            return "BIGINT" if s.dtype.itemsize == 8 else "INTEGER"
+        if s.dtype.kind == "f":
+            return "REAL" if s.dtype.itemsize == 4 else "DOUBLE"
+        if s.dtype.kind == "M":
+            return "DATE" if s.name.endswith("_date") else "TIMESTAMP"
+        return "VARCHAR"
+
+    def insert(self, name, df):
+        # the chunk is scanned column by column, no per-row Python values
+        exprs = []
+        for c, kind in self.columns[name].items():
+            if kind == "VARCHAR":
+                exprs.append(f'NULLIF(CAST("{c}" AS VARCHAR), \'\')')
+            else:
+                exprs.append(f'CAST("{c}" AS {kind})')
+        frame = df.copy(deep=False)
+        for c in frame.columns:
+            if frame[c].dtype == object:   # mixed text/number columns (rows engine) as text
+                frame[c] = frame[c].where(frame[c].isna(), frame[c].astype(str))
+        if self.arrow is not None:
+            frame = self.arrow.Table.from_pandas(frame, preserve_index=False)
+        self.con.register("chunk", frame)
+        self.con.execute("BEGIN TRANSACTION")
+        try:
+            self.con.execute(f'INSERT INTO "{name}" SELECT {", ".join(exprs)} FROM chunk')
+        except BaseException:
+            self.con.execute("ROLLBACK")
+            raise
+        finally:
+            self.con.unregister("chunk")
+        self.con.execute("COMMIT")
+
+    def commit(self):
+        self.con.execute("CHECKPOINT")
+
+class SqlWriter:
+    # the table writer interface (write/close) on top of a database sink
+    def __init__(self, sink, name):
+        self.sink, self.name = sink, name
+
+    def write(self, df):
+        self.sink.load(self.name, df)
+
+    def close(self):
+        pass
+
+def open_sink(spec):
+    # "sqlite:path.db" / "duckdb:path.duckdb"
+    kind, _, path = spec.partition(":")
+    if kind not in SINKS or not path:
+        raise ValueError(f"--sink expects {' or '.join(k + ':PATH' for k in SINKS)}, got {spec!r}")
+    return SqliteSink(path) if kind == "sqlite" else DuckdbSink(path)
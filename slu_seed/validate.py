@@ -0,0 +1,131 @@
+# SLU Alumni Project — referential integrity
+# Checks that every foreign key in FOREIGN_KEYS resolves, for generated tables and for
+# database extracts such as Alumni_1000_20_1.csv. Each parent's primary keys become a
+# sorted array of 64-bit hashes (8 bytes per key); children are streamed in chunks,
+# reading only their key columns. Key columns lead every layout (primary key first,
+# then the foreign keys in FOREIGN_KEYS order), so headerless extracts -- the 6-column
+# alumni and 21-column employers exports included -- are read by position.
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .dictionary import value_hashes
+from .keys import FOREIGN_KEYS, PRIMARY_KEYS, TABLE_NAMES
+
+VALIDATE_CHUNK_ROWS = 200_000
+ORPHAN_SAMPLE = 5
+VALIDATION_COLUMNS = ["check", "table", "column", "references", "rows", "nulls", "violations", "sample"]
+
+def key_columns(table):
+    return [PRIMARY_KEYS[table]] + [c for (t, c) in FOREIGN_KEYS if t == table]
+
+def table_for_file(path):
+    # students_1.csv, Alumni_1000_20_1.csv, engagements_1.parquet, ... -> table name
+    base = os.path.basename(path).lower()
+    for table in TABLE_NAMES:
+        if base.startswith(table.rsplit("_", 1)[0]):
+            return table
+    raise ValueError(f"can't tell which table {path} holds; pass it as TABLE=PATH")
+
+def normalize_keys(values):
+    # text keys as in the generated files: trimmed, lower-case GUIDs, NULL/"" missing
+    values = values.astype("string").str.strip().str.lower()
+    return values.mask(values.isin(["", "null"]))
+
+def read_keys(path, table, cols, chunksize=None):
+    # yields DataFrames of the raw key columns `cols` (all text), chunk by chunk
+    chunksize = chunksize or VALIDATE_CHUNK_ROWS
+    try:
+        import pyarrow as pa
+    except ImportError:
+        if path.endswith((".parquet", ".feather")):
+            raise ImportError(f"reading {path} needs pyarrow (pip install pyarrow)") from None
+        pa = None
+    def text(batch):
+        # cast in Arrow: int keys with nulls would come out of pandas as floats
+        return pd.DataFrame({c: batch.column(c).cast(pa.string()).to_pandas() for c in cols}, dtype="string")
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(chunksize, columns=cols):
+            yield text(batch)
+        return
+    if path.endswith(".feather"):
+        with pa.memory_map(path) as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                yield text(reader.get_batch(i))
+        return
+    headerless = PRIMARY_KEYS[table] not in pd.read_csv(path, nrows=0, encoding="utf-8-sig").columns
+    if headerless:
+        if set(cols) - set(key_columns(table)):
+            raise ValueError(f"{path} has no header row; only its key columns can be read")
+        cols = sorted(cols, key=key_columns(table).index)
+    positions = [key_columns(table).index(c) for c in cols] if headerless else cols
+    if pa is not None:
+        # Arrow's streaming reader parses in parallel, ~5x pandas' chunked read_csv
+        import pyarrow.csv as pcsv
+        names = [f"f{i}" for i in positions] if headerless else cols
+        stream = pcsv.open_csv(
+            pa.input_stream(path, compression="detect"),
+            read_options=pcsv.ReadOptions(autogenerate_column_names=headerless, block_size=1 << 22),
+            convert_options=pcsv.ConvertOptions(include_columns=names, strings_can_be_null=False,
+                                                column_types={c: pa.string() for c in names}))
+        for batch in stream:
+            yield pd.DataFrame({c: batch.column(n).to_pandas() for c, n in zip(cols, names)}, dtype="string")
+        return
+    for df in pd.read_csv(path, header=None if headerless else "infer", usecols=positions, dtype=str,
+                          keep_default_na=False, encoding="utf-8-sig", chunksize=chunksize):
+        if headerless:
+            df.columns = cols
+        yield df
+
+def orphans(known, hashes):
+    # mask of hashes missing from the sorted array `known`; the lookups go in sorted
+    # order so the binary searches walk `known` front to back instead of at random
+    missing = np.ones(len(hashes), dtype=bool)
+    if len(known):
+        order = np.argsort(hashes)
+        needles = hashes[order]
+        pos = np.minimum(np.searchsorted(known, needles), len(known) - 1)
+        missing[order] = known[pos] != needles
+    return missing
+
+def check_references(files, chunksize=None):
+    # files: {table: path}. One row per primary key and per foreign key whose parent file
+    # is given; violations are duplicate primary keys or orphan foreign keys. Tables go
+    # parents-first (TABLE_NAMES order), so each file is read once: its foreign keys are
+    # checked against the parents already hashed, then its own primary keys are kept.
+    pk_rows, fk_rows, parents = [], [], {}
+    for table in sorted(files, key=TABLE_NAMES.index):
+        pk = PRIMARY_KEYS[table]
+        fks = {c: parent for (t, c), parent in FOREIGN_KEYS.items() if t == table and parent in files}
+        stats = {c: {"rows": 0, "nulls": 0, "violations": 0, "sample": []} for c in [pk, *fks]}
+        parts = []
+        for df in read_keys(files[table], table, [pk, *fks], chunksize):
+            for col in stats:
+                st = stats[col]
+                keys = normalize_keys(df[col])
+                present = keys.notna().to_numpy()
+                h = value_hashes(keys[present])
+                st["rows"] += len(keys)
+                st["nulls"] += int((~present).sum())
+                if col == pk:
+                    parts.append(h)
+                    continue
+                orphan = orphans(parents[fks[col]], h)
+                st["violations"] += int(orphan.sum())
+                if orphan.any() and len(st["sample"]) < ORPHAN_SAMPLE:
+                    st["sample"] += df[col][present][orphan].head(ORPHAN_SAMPLE - len(st["sample"])).tolist()
+        hashes = np.sort(np.concatenate(parts)) if parts else np.empty(0, dtype=np.uint64)
+        repeat = hashes[1:] == hashes[:-1]   # sort + neighbour compare; np.unique is far slower here
+        parents[table] = hashes[np.concatenate([[True], ~repeat])] if len(hashes) else hashes
+        st = stats.pop(pk)
+        pk_rows.append(dict(st, check="primary key", table=table, column=pk, references="", sample="",
+                            violations=int(repeat.sum()) + st["nulls"]))
+        for col, parent in fks.items():
+            fk_rows.append(dict(stats[col], check="foreign key", table=table, column=col,
+                                references=f"{parent}.{PRIMARY_KEYS[parent]}",
+                                sample=" | ".join(stats[col]["sample"])))
+    return pd.DataFrame(pk_rows + fk_rows, columns=VALIDATION_COLUMNS)
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# SLU Alumni Project — referential integrity check
+# Streams each table's key columns and reports duplicate primary keys and foreign keys
+# that don't resolve (orphans), with a few sample values. Works on the generated tables
+# (csv, csv.gz, csv.zst, parquet, feather) and on the headerless database extracts
+# (Alumni_1000_20_1.csv, Employers_1000_20_1.csv, ...). Exits with status 1 on violations.
+# Run:
+#   python validate_keys.py [FILE | TABLE=FILE ...] [--dir DIR] [--format FMT]
+#                           [--chunk-rows N] [--report FILE.csv|FILE.json]
+
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+from slu_seed.formats import FORMATS
+from slu_seed.keys import FOREIGN_KEYS, PRIMARY_KEYS, TABLE_NAMES
+from slu_seed.validate import VALIDATE_CHUNK_ROWS, check_references, table_for_file
+
+def table_files(paths, out_dir=".", fmt="csv"):
+    # explicit FILE / TABLE=FILE arguments, or every generated table found in out_dir
+    if not paths:
+        files = {t: os.path.join(out_dir, f"{t}.{fmt}") for t in TABLE_NAMES}
+        return {t: p for t, p in files.items() if os.path.exists(p)}
+    files = {}
+    for arg in paths:
+        table, sep, path = arg.partition("=")
+        if not sep:
+            table, path = table_for_file(arg), arg
+        if table not in PRIMARY_KEYS:
+            raise ValueError(f"unknown table {table!r} in {arg}")
+        files[table] = path
+    return files
+
+def parse_args(argv=None):
+    ap = argparse.ArgumentParser(description="Check primary and foreign keys across the SLU alumni tables.")
+    ap.add_argument("files", nargs="*", metavar="FILE",
+                    help="table files, named like the tables or given as TABLE=FILE (default: the generated tables)")
+    ap.add_argument("--dir", default=".", help="where to look for the generated tables (default: current)")
+    ap.add_argument("--format", choices=FORMATS, default="csv")
+    ap.add_argument("--chunk-rows", type=int, default=VALIDATE_CHUNK_ROWS,
+                    help="rows read per chunk (default: %(default)s)")
+    ap.add_argument("--report", help="also save the results as .csv or .json")
+    return ap.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        files = table_files(args.files, args.dir, args.format)
+    except ValueError as e:
+        sys.exit(f"error: {e}")
+    if not files:
+        sys.exit("error: no table files found")
+    results = check_references(files, args.chunk_rows)
+
+    with pd.option_context("display.width", 160, "display.max_colwidth", 80, "display.max_rows", None):
+        print(results.to_string(index=False))
+    if args.report:
+        if args.report.endswith(".json"):
+            results.to_json(args.report, orient="records", indent=2)
+        else:
+            results.to_csv(args.report, index=False)
+    skipped = sorted({p for (t, c), p in FOREIGN_KEYS.items() if t in files and p not in files})
+    if skipped:
+        print(f"\nnot checked (parent table not given): references to {', '.join(skipped)}")
+    if results["violations"].sum():
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()